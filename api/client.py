@@ -5,11 +5,13 @@ This module implements a robust API client that handles retries, rate limiting,
 JSON parsing errors, and includes a self-correction mechanism for malformed responses.
 """
 
+import functools
 import json
 import time
 import hashlib
 import logging
 import re
+import threading
 from typing import Dict, Any, Optional, Type, TypeVar
 from pathlib import Path
 
@@ -27,6 +29,55 @@ logger = logging.getLogger(__name__)
 # Type variable for Pydantic models
 T = TypeVar('T', bound=BaseModel)
 
+# Markdown code fences some models wrap around JSON output
+_JSON_FENCE_OPEN_RE = re.compile(r'```json\s*')
+_JSON_FENCE_CLOSE_RE = re.compile(r'```\s*$')
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_instructions(response_model: Type[BaseModel]) -> str:
+    """
+    Render the JSON-format instructions for a response model.
+    
+    The text depends only on the model's schema, so it is built once per model
+    instead of regenerating and walking the JSON schema on every request.
+    """
+    schema = response_model.model_json_schema()
+    
+    # Extract required fields from schema
+    properties = schema.get("properties", {})
+    required_fields = schema.get("required", [])
+    
+    # Build field descriptions
+    field_descriptions = []
+    for field_name, field_info in properties.items():
+        description = field_info.get("description", "")
+        field_type = field_info.get("type", "string")
+        is_required = field_name in required_fields
+        
+        req_str = " (required)" if is_required else " (optional)"
+        field_descriptions.append(f"- {field_name}: {field_type}{req_str} - {description}")
+    
+    fields_str = "\n".join(field_descriptions)
+    
+    return f"""IMPORTANT: You must respond with a valid JSON object with these fields:
+
+{fields_str}
+
+Requirements:
+- Respond ONLY with the JSON object, no additional text
+- Include all required fields
+- Use appropriate data types (strings, numbers, arrays, etc.)
+
+Example format:
+{{
+  "field1": "value1",
+  "field2": 123,
+  "field3": ["item1", "item2"]
+}}
+
+Your JSON response:"""
+
 
 class ResilientAPIClient:
     """
@@ -39,7 +90,9 @@ class ResilientAPIClient:
         max_retries: int = 3,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_concurrent_requests: Optional[int] = None,
+        response_cache=None
     ):
         """
         Initialize the API client.
@@ -50,6 +103,8 @@ class ResilientAPIClient:
             base_delay: Base delay for exponential backoff (seconds)
             max_delay: Maximum delay between retries (seconds)
             timeout: Request timeout in seconds
+            max_concurrent_requests: Cap on in-flight requests across threads (None = unlimited)
+            response_cache: Optional CacheManager used to reuse validated responses
         """
         self.client = OpenAI(api_key=api_key)
         self.max_retries = max_retries
@@ -57,6 +112,16 @@ class ResilientAPIClient:
         self.max_delay = max_delay
         self.timeout = timeout
         
+        # Worker threads share this client; bound how many requests are on the wire at once
+        self._request_slots = (
+            threading.BoundedSemaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
+        # A rate limit hit by one worker pauses all of them until the provider's window clears
+        self._throttle_lock = threading.Lock()
+        self._throttled_until = 0.0
+        
+        self.response_cache = response_cache
+        
         # Statistics
         self.total_requests = 0
         self.successful_requests = 0
@@ -69,7 +134,8 @@ class ResilientAPIClient:
         model: str,
         response_model: Type[T],
         temperature: float = 0.0,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        system_prompt: Optional[str] = None
     ) -> T:
         """
         Get a structured response from the LLM that conforms to a Pydantic schema.
@@ -80,6 +146,8 @@ class ResilientAPIClient:
             response_model: Pydantic model class for response validation
             temperature: Sampling temperature (0.0 for deterministic)
             max_tokens: Maximum tokens in response
+            system_prompt: Static task instructions sent ahead of the schema in the
+                system message (optional)
             
         Returns:
             Validated Pydantic model instance
@@ -91,25 +159,34 @@ class ResilientAPIClient:
         """
         self.total_requests += 1
         
-        # Generate JSON schema from Pydantic model
-        schema = response_model.model_json_schema()
+        # Task and schema instructions lead as a system message, rendered once per response model
+        messages = self._build_structured_messages(prompt, response_model, system_prompt)
+        enhanced_prompt = "\n\n".join(message["content"] for message in messages)
         
-        # Enhanced prompt with schema
-        enhanced_prompt = self._build_structured_prompt(prompt, schema)
+        logger.debug("Making API request to model: %s", model)
         
-        logger.debug(f"Making API request to model: {model}")
-        
-        # Sanitize Unicode characters to prevent encoding errors
-        enhanced_prompt = self._sanitize_unicode(enhanced_prompt)
+        # Reprocessing the same album yields the same prompt; skip the round-trip
+        if self.response_cache:
+            cached = self.response_cache.get_api_response(
+                enhanced_prompt, model, temperature=temperature, max_tokens=max_tokens
+            )
+            if cached:
+                try:
+                    validated_response = response_model.model_validate(cached)
+                    self.successful_requests += 1
+                    logger.debug("Using cached API response")
+                    return validated_response
+                except ValidationError as e:
+                    logger.debug("Ignoring stale cached response: %s", e)
         
         for attempt in range(self.max_retries + 1):
             try:
-                logger.debug(f"API request attempt {attempt + 1}/{self.max_retries + 1}")
+                logger.debug("API request attempt %s/%s", attempt + 1, self.max_retries + 1)
                 
                 # Use appropriate parameter based on model
                 completion_params = {
                     "model": model,
-                    "messages": [{"role": "user", "content": enhanced_prompt}],
+                    "messages": messages,
                     "timeout": self.timeout
                 }
                 
@@ -128,11 +205,11 @@ class ResilientAPIClient:
                         gpt5_max_tokens = max(max_tokens * 4, 4000)  # At least 4000 tokens
                     
                     completion_params["max_completion_tokens"] = gpt5_max_tokens
-                    logger.debug(f"Using token limit for {model}: {gpt5_max_tokens}")
+                    logger.debug("Using token limit for %s: %s", model, gpt5_max_tokens)
                     
                     # GPT-5 only supports default temperature (1), not 0.0
                     if temperature != 0.0 and temperature != 1.0:
-                        logger.debug(f"GPT-5 doesn't support temperature={temperature}, using default (1.0)")
+                        logger.debug("GPT-5 doesn't support temperature=%s, using default (1.0)", temperature)
                     # For deterministic output with GPT-5, we rely on the model's default behavior
                     # Don't set temperature parameter at all to use default
                     
@@ -144,10 +221,10 @@ class ResilientAPIClient:
                     completion_params["temperature"] = temperature
                     completion_params["response_format"] = {"type": "json_object"}
                 
-                response = self.client.chat.completions.create(**completion_params)
+                response = self._create_completion(completion_params)
                 
                 # Log response details for debugging
-                logger.debug(f"API Response - Model: {model}, Choices: {len(response.choices)}")
+                logger.debug("API Response - Model: %s, Choices: %s", model, len(response.choices))
                 
                 # Extract content
                 if not response.choices:
@@ -161,8 +238,8 @@ class ResilientAPIClient:
                 content = choice.message.content
                 
                 # Log the message structure for debugging
-                logger.debug(f"Message type: {type(choice.message)}, Has content: {hasattr(choice.message, 'content')}")
-                logger.debug(f"Response content length: {len(content) if content else 0}")
+                logger.debug("Message type: %s, Has content: %s", type(choice.message), hasattr(choice.message, 'content'))
+                logger.debug("Response content length: %s", len(content) if content else 0)
                 
                 if not content:
                     # Check the finish reason to understand why content is empty
@@ -182,7 +259,7 @@ class ResilientAPIClient:
                     # Try to get any available text from the response
                     if hasattr(choice.message, 'text'):
                         content = choice.message.text
-                        logger.debug(f"Found content in 'text' field: {len(content) if content else 0} chars")
+                        logger.debug("Found content in 'text' field: %s chars", len(content) if content else 0)
                     
                     if not content:
                         raise APISchemaError(
@@ -193,14 +270,14 @@ class ResilientAPIClient:
                 
                 # Parse and validate JSON
                 try:
-                    parsed_data = json.loads(content)
-                    validated_response = response_model.model_validate(parsed_data)
+                    validated_response = self._validate_json(content, response_model)
                     
                     self.successful_requests += 1
                     if attempt > 0:
                         self.retried_requests += 1
                     
-                    logger.debug(f"Successful API response after {attempt + 1} attempts")
+                    self._cache_response(enhanced_prompt, model, validated_response, temperature, max_tokens)
+                    logger.debug("Successful API response after %s attempts", attempt + 1)
                     return validated_response
                     
                 except json.JSONDecodeError as e:
@@ -210,13 +287,13 @@ class ResilientAPIClient:
                     repaired_content = self._attempt_json_repair(content, str(e), model)
                     if repaired_content:
                         try:
-                            parsed_data = json.loads(repaired_content)
-                            validated_response = response_model.model_validate(parsed_data)
+                            validated_response = self._validate_json(repaired_content, response_model)
                             
                             self.successful_requests += 1
                             if attempt > 0:
                                 self.retried_requests += 1
                             
+                            self._cache_response(enhanced_prompt, model, validated_response, temperature, max_tokens)
                             logger.info("Successfully repaired and validated JSON response")
                             return validated_response
                             
@@ -239,11 +316,11 @@ class ResilientAPIClient:
                         )
             
             except openai.RateLimitError as e:
-                retry_after = getattr(e, 'retry_after', None) or 60
-                logger.warning(f"Rate limit hit, waiting {retry_after} seconds")
+                retry_after = self._rate_limit_delay(e, attempt)
+                logger.warning(f"Rate limit hit, waiting {retry_after:.1f} seconds")
                 
                 if attempt < self.max_retries:
-                    time.sleep(retry_after)
+                    self._pause_requests(retry_after)
                     continue
                 else:
                     raise APIRateLimitError(retry_after)
@@ -284,44 +361,59 @@ class ResilientAPIClient:
         self.failed_requests += 1
         raise APICommunicationError("Max retries exceeded")
     
-    def _build_structured_prompt(self, prompt: str, schema: Dict[str, Any]) -> str:
-        """Build an enhanced prompt with JSON schema instructions."""
-        # Extract required fields from schema
-        properties = schema.get("properties", {})
-        required_fields = schema.get("required", [])
-        
-        # Build field descriptions
-        field_descriptions = []
-        for field_name, field_info in properties.items():
-            description = field_info.get("description", "")
-            field_type = field_info.get("type", "string")
-            is_required = field_name in required_fields
-            
-            req_str = " (required)" if is_required else " (optional)"
-            field_descriptions.append(f"- {field_name}: {field_type}{req_str} - {description}")
+    def _build_structured_messages(
+        self,
+        prompt: str,
+        response_model: Type[BaseModel],
+        system_prompt: Optional[str] = None
+    ) -> list:
+        """
+        Build the chat messages for a structured request.
         
-        fields_str = "\n".join(field_descriptions)
+        The caller's task instructions and the schema instructions are identical for
+        every request with the same stage and response model, so they go first as the
+        system message. That keeps the request prefix byte-identical across albums,
+        which lets provider-side prefix caching reuse it; only the album-specific user
+        message varies.
+        """
+        system_content = _schema_instructions(response_model)
+        if system_prompt:
+            system_content = f"{system_prompt}\n\n{system_content}"
+        return [
+            {"role": "system", "content": system_content},
+            # Sanitize Unicode characters to prevent encoding errors
+            {"role": "user", "content": self._sanitize_unicode(prompt)}
+        ]
+    
+    def _validate_json(self, content: str, response_model: Type[T]) -> T:
+        """
+        Parse and validate a JSON response in a single pass.
         
-        return f"""
-{prompt}
-
-IMPORTANT: You must respond with a valid JSON object with these fields:
-
-{fields_str}
-
-Requirements:
-- Respond ONLY with the JSON object, no additional text
-- Include all required fields
-- Use appropriate data types (strings, numbers, arrays, etc.)
-
-Example format:
-{{
-  "field1": "value1",
-  "field2": 123,
-  "field3": ["item1", "item2"]
-}}
-
-Your JSON response:"""
+        Pydantic's native JSON parser builds the model straight from the text without
+        an intermediate dict. Malformed JSON is re-raised as json.JSONDecodeError so
+        callers keep their repair path.
+        """
+        try:
+            return response_model.model_validate_json(content)
+        except ValidationError as e:
+            if any(error['type'] == 'json_invalid' for error in e.errors()):
+                json.loads(content)  # raises JSONDecodeError with position details
+            raise
+    
+    def _cache_response(
+        self,
+        prompt: str,
+        model: str,
+        response: BaseModel,
+        temperature: float,
+        max_tokens: int
+    ):
+        """Store a validated response in the response cache, if one is configured."""
+        if self.response_cache:
+            self.response_cache.cache_api_response(
+                prompt, model, response.model_dump(mode='json'),
+                temperature=temperature, max_tokens=max_tokens
+            )
     
     def _attempt_json_repair(
         self, 
@@ -376,7 +468,7 @@ Corrected JSON:"""
                 repair_params["max_tokens"] = len(malformed_json) + 100
                 repair_params["temperature"] = 0.0
             
-            response = self.client.chat.completions.create(**repair_params)
+            response = self._create_completion(repair_params)
             
             repaired_content = response.choices[0].message.content
             if repaired_content:
@@ -393,8 +485,8 @@ Corrected JSON:"""
     def _clean_json_response(self, response: str) -> str:
         """Clean up JSON response by removing code fences and extra text."""
         # Remove markdown code fences
-        response = re.sub(r'```json\s*', '', response)
-        response = re.sub(r'```\s*$', '', response)
+        response = _JSON_FENCE_OPEN_RE.sub('', response)
+        response = _JSON_FENCE_CLOSE_RE.sub('', response)
         
         # Find the JSON object boundaries
         first_brace = response.find('{')
@@ -405,6 +497,47 @@ Corrected JSON:"""
         
         return response.strip()
     
+    def _create_completion(self, params: Dict[str, Any]):
+        """Send a chat completion through the shared rate-limit pause and concurrency slots."""
+        self._wait_for_rate_limit()
+        
+        if self._request_slots:
+            with self._request_slots:
+                return self.client.chat.completions.create(**params)
+        return self.client.chat.completions.create(**params)
+    
+    def _pause_requests(self, seconds: float):
+        """Hold back every worker's next request for the given number of seconds."""
+        with self._throttle_lock:
+            self._throttled_until = max(self._throttled_until, time.monotonic() + seconds)
+    
+    def _wait_for_rate_limit(self):
+        """Sleep until any shared rate-limit pause has elapsed."""
+        delay = self._throttled_until - time.monotonic()
+        if delay > 0:
+            logger.debug("Rate limited, holding request for %.1f seconds", delay)
+            time.sleep(delay)
+    
+    def _rate_limit_delay(self, error: openai.RateLimitError, attempt: int) -> float:
+        """Seconds to hold requests after a 429: the server's Retry-After if given, else backoff."""
+        response = getattr(error, 'response', None)
+        headers = response.headers if response is not None else {}
+        
+        # OpenAI sends retry-after-ms alongside the standard Retry-After (seconds);
+        # HTTP-date values are not used by the API and fall through to backoff
+        for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                delay = float(value) * scale
+            except ValueError:
+                continue
+            if delay > 0:
+                return delay
+        
+        return self._calculate_backoff_delay(attempt)
+    
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay with jitter."""
         # Exponential backoff: base_delay * 2^attempt
@@ -447,6 +580,10 @@ Corrected JSON:"""
         Returns:
             Sanitized text safe for UTF-8 encoding
         """
+        # Most prompts are plain ASCII, which always encodes cleanly
+        if text.isascii():
+            return text
+        
         try:
             # First, try to encode/decode to catch surrogate errors
             text.encode('utf-8')
@@ -454,19 +591,12 @@ Corrected JSON:"""
         except UnicodeEncodeError:
             logger.debug("Found problematic Unicode characters, sanitizing...")
             
-            # Replace or remove problematic characters
-            sanitized_chars = []
-            for char in text:
-                try:
-                    # Test if this character can be encoded
-                    char.encode('utf-8')
-                    sanitized_chars.append(char)
-                except UnicodeEncodeError:
-                    # Replace problematic characters with a safe alternative
-                    # Use the Unicode replacement character or a simple placeholder
-                    sanitized_chars.append('?')
-            
-            sanitized_text = ''.join(sanitized_chars)
-            logger.debug(f"Sanitized text: removed/replaced {len(text) - len([c for c in sanitized_chars if c != '?'])} problematic characters")
+            # Replace problematic characters in a single codec pass; lone
+            # surrogates become '?'
+            sanitized_text = text.encode('utf-8', errors='replace').decode('utf-8')
+            if logger.isEnabledFor(logging.DEBUG):
+                # Counting scans the prompt twice; only pay for it when debugging
+                logger.debug("Sanitized text: replaced %s problematic characters",
+                             sanitized_text.count('?') - text.count('?'))
             
             return sanitized_text
\ No newline at end of file
@@ -23,9 +23,21 @@ class AlbumInfo(BaseModel):
     disc_subdirs: List[str] = Field(default_factory=list, description="Disc subdirectory names if any")
     total_size_mb: float = Field(..., description="Total album size in MB")
     sample_metadata: Dict[str, Any] = Field(default_factory=dict, description="Metadata from sample tracks")
+    music_root: Optional[Path] = Field(None, description="Library root the album sits under (derived from album_path and parent_dirs)")
     
     class Config:
         arbitrary_types_allowed = True
+    
+    @validator('music_root', pre=True, always=True)
+    def derive_music_root(cls, v, values):
+        """Resolve the library root once instead of on every path build."""
+        if v is not None or 'album_path' not in values:
+            return v
+        parents = Path(values['album_path']).parents
+        depth = len(values.get('parent_dirs', []))
+        if depth >= len(parents):
+            raise ValueError(f"parent_dirs is deeper than album_path: {values['album_path']}")
+        return parents[depth]
 
 
 class RawFileInfo(BaseModel):
@@ -291,12 +303,14 @@ class FinalAlbumInfo(EnrichedAlbumInfo):
 class AlbumProcessingResult(BaseModel):
     """Result of processing a single album."""
     
-    album_info: AlbumInfo
+    album_info: Optional[AlbumInfo] = None
+    album_path: Optional[Path] = None
     success: bool
     final_album_info: Optional[FinalAlbumInfo] = None
     error_message: Optional[str] = None
     processing_time_seconds: float
     pipeline_stage_completed: str
+    stage_timings: Dict[str, float] = Field(default_factory=dict, description="Wall time in seconds per pipeline stage run")
     
     class Config:
         arbitrary_types_allowed = True
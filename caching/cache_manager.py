@@ -7,15 +7,17 @@ Layer 3 (L3): Semantic Cache - Future enhancement for semantic similarity matchi
 """
 
 import json
+import os
 import sqlite3
 import hashlib
+import threading
 import time
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
-from api.schemas import FinalTrackInfo
+from api.schemas import AlbumInfo, FinalAlbumInfo, FinalTrackInfo
 from utils.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
@@ -52,6 +54,27 @@ class L1ExecutionCache:
                     ON processed_files(processed_timestamp)
                 """)
                 
+                # Album scans, reused while the album directory is unchanged
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS album_scans (
+                        album_path TEXT PRIMARY KEY,
+                        signature TEXT,
+                        album_info TEXT,
+                        scanned_timestamp REAL
+                    )
+                """)
+                
+                # Final album results, reused while the album and pipeline settings are unchanged
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS album_results (
+                        album_path TEXT PRIMARY KEY,
+                        signature TEXT,
+                        settings TEXT,
+                        final_album_info TEXT,
+                        processed_timestamp REAL
+                    )
+                """)
+                
                 conn.commit()
                 logger.debug(f"Initialized execution cache database: {self.cache_file}")
                 
@@ -148,6 +171,148 @@ class L1ExecutionCache:
         
         return None
     
+    @staticmethod
+    def _album_scan_signature(album_info: AlbumInfo) -> str:
+        """
+        Fingerprint an album directory with a few modification times.
+        
+        The album and disc directories change when tracks are added, removed or
+        renamed; the sampled tracks change when their tags are edited.
+        """
+        album_path = album_info.album_path
+        paths = [
+            album_path,
+            *(album_path / disc for disc in album_info.disc_subdirs),
+            *album_info.track_paths[:3]
+        ]
+        return json.dumps([path.stat().st_mtime_ns for path in paths])
+    
+    def get_album_scan(self, album_path: Path) -> Optional[AlbumInfo]:
+        """
+        Get the stored Stage 1 scan for an album if the directory is unchanged.
+        
+        Args:
+            album_path: Path to the album directory
+            
+        Returns:
+            The cached AlbumInfo, or None if missing or stale
+        """
+        try:
+            with sqlite3.connect(str(self.cache_file)) as conn:
+                cursor = conn.execute("""
+                    SELECT signature, album_info 
+                    FROM album_scans 
+                    WHERE album_path = ?
+                """, (str(album_path),))
+                
+                result = cursor.fetchone()
+            
+            if result:
+                signature, album_info_json = result
+                album_info = AlbumInfo.model_validate_json(album_info_json)
+                if self._album_scan_signature(album_info) == signature:
+                    logger.debug(f"Album scan found in execution cache: {album_path}")
+                    return album_info
+                
+        except FileNotFoundError:
+            # A sampled track or disc folder was removed; rescan
+            pass
+        except (OSError, sqlite3.Error, ValueError) as e:
+            logger.warning(f"Error checking album scan cache: {e}")
+        
+        return None
+    
+    def cache_album_scan(self, album_info: AlbumInfo):
+        """
+        Store a Stage 1 album scan with the directory fingerprint it was taken at.
+        
+        Args:
+            album_info: The analyzed album
+        """
+        try:
+            signature = self._album_scan_signature(album_info)
+            
+            with sqlite3.connect(str(self.cache_file)) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO album_scans 
+                    (album_path, signature, album_info, scanned_timestamp)
+                    VALUES (?, ?, ?, ?)
+                """, (
+                    str(album_info.album_path),
+                    signature,
+                    album_info.model_dump_json(),
+                    time.time()
+                ))
+                conn.commit()
+                
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Error caching album scan: {e}")
+    
+    def get_album_result(self, album_info: AlbumInfo, settings: str) -> Optional[FinalAlbumInfo]:
+        """
+        Get the stored final result for an album if neither it nor the settings changed.
+        
+        Args:
+            album_info: The analyzed album
+            settings: Fingerprint of the models and options that produced the result
+            
+        Returns:
+            The cached FinalAlbumInfo, or None if missing or stale
+        """
+        try:
+            with sqlite3.connect(str(self.cache_file)) as conn:
+                cursor = conn.execute("""
+                    SELECT signature, settings, final_album_info 
+                    FROM album_results 
+                    WHERE album_path = ?
+                """, (str(album_info.album_path),))
+                
+                result = cursor.fetchone()
+            
+            if result:
+                signature, cached_settings, final_info_json = result
+                if (cached_settings == settings
+                        and self._album_scan_signature(album_info) == signature):
+                    logger.debug(f"Album result found in execution cache: {album_info.album_path}")
+                    return FinalAlbumInfo.model_validate_json(final_info_json)
+                
+        except FileNotFoundError:
+            # A sampled track or disc folder was removed; reprocess
+            pass
+        except (OSError, sqlite3.Error, ValueError) as e:
+            logger.warning(f"Error checking album result cache: {e}")
+        
+        return None
+    
+    def cache_album_result(self, album_info: AlbumInfo, settings: str, final_info: FinalAlbumInfo):
+        """
+        Store an album's final result with the directory fingerprint and settings it was made with.
+        
+        Args:
+            album_info: The analyzed album
+            settings: Fingerprint of the models and options that produced the result
+            final_info: The Stage 4 result
+        """
+        try:
+            signature = self._album_scan_signature(album_info)
+            
+            with sqlite3.connect(str(self.cache_file)) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO album_results 
+                    (album_path, signature, settings, final_album_info, processed_timestamp)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (
+                    str(album_info.album_path),
+                    signature,
+                    settings,
+                    final_info.model_dump_json(),
+                    time.time()
+                ))
+                conn.commit()
+                
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Error caching album result: {e}")
+    
     def cleanup_old_entries(self, days_old: int = 30):
         """Remove cache entries older than specified days."""
         try:
@@ -160,6 +325,16 @@ class L1ExecutionCache:
                 """, (cutoff_time,))
                 
                 deleted = cursor.rowcount
+                
+                conn.execute("""
+                    DELETE FROM album_scans 
+                    WHERE scanned_timestamp < ?
+                """, (cutoff_time,))
+                
+                conn.execute("""
+                    DELETE FROM album_results 
+                    WHERE processed_timestamp < ?
+                """, (cutoff_time,))
                 conn.commit()
                 
                 if deleted > 0:
@@ -174,11 +349,19 @@ class L2APICache:
     Layer 2: API Cache for caching LLM responses to avoid duplicate API calls.
     """
     
+    # Number of new responses kept in memory before the cache is checkpointed to disk
+    SAVE_INTERVAL = 10
+    
     def __init__(self, cache_file: Path, expiry_days: int = 30):
         self.cache_file = cache_file
         self.expiry_days = expiry_days
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
         self._cache_data = self._load_cache()
+        # Album workers share this cache: _lock guards the in-memory entries and is
+        # only held briefly, while _save_lock serializes the slow disk checkpoints
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._unsaved_entries = 0
     
     def _load_cache(self) -> Dict[str, Any]:
         """Load cache from file."""
@@ -195,10 +378,19 @@ class L2APICache:
     
     def _save_cache(self):
         """Save cache to file."""
+        # Write a sibling file and swap it in, so an interrupted run never leaves
+        # a truncated cache behind (which would discard every saved response)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self._cache_data, f, ensure_ascii=False, indent=2)
-                logger.debug(f"Saved API cache with {len(self._cache_data)} entries")
+            with self._save_lock:
+                # Serialize a snapshot so other workers can keep caching during the write
+                with self._lock:
+                    snapshot = dict(self._cache_data)
+                    self._unsaved_entries = 0
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, self.cache_file)
+                logger.debug(f"Saved API cache with {len(snapshot)} entries")
         except IOError as e:
             logger.warning(f"Error saving API cache: {e}")
     
@@ -228,8 +420,8 @@ class L2APICache:
         """
         cache_key = self._generate_cache_key(prompt, model, **kwargs)
         
-        if cache_key in self._cache_data:
-            cached_entry = self._cache_data[cache_key]
+        cached_entry = self._cache_data.get(cache_key)
+        if cached_entry is not None:
             cached_time = cached_entry.get('timestamp', 0)
             
             # Check if cache entry is still valid
@@ -238,7 +430,8 @@ class L2APICache:
                 return cached_entry.get('response')
             else:
                 # Remove expired entry
-                del self._cache_data[cache_key]
+                with self._lock:
+                    self._cache_data.pop(cache_key, None)
                 logger.debug("API cache entry expired, removed")
         
         return None
@@ -255,14 +448,20 @@ class L2APICache:
         """
         cache_key = self._generate_cache_key(prompt, model, **kwargs)
         
-        self._cache_data[cache_key] = {
-            'timestamp': time.time(),
-            'response': response,
-            'model': model
-        }
+        with self._lock:
+            self._cache_data[cache_key] = {
+                'timestamp': time.time(),
+                'response': response,
+                'model': model
+            }
+            
+            # Checkpoint periodically so a crashed run resumes from recent responses
+            self._unsaved_entries += 1
+            checkpoint_due = self._unsaved_entries >= self.SAVE_INTERVAL
+            if checkpoint_due:
+                self._unsaved_entries = 0
         
-        # Save cache periodically (every 10 new entries)
-        if len(self._cache_data) % 10 == 0:
+        if checkpoint_due:
             self._save_cache()
         
         logger.debug("Cached API response")
@@ -272,13 +471,14 @@ class L2APICache:
         current_time = time.time()
         expiry_threshold = self.expiry_days * 24 * 3600
         
-        expired_keys = []
-        for key, entry in self._cache_data.items():
-            if current_time - entry.get('timestamp', 0) > expiry_threshold:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache_data[key]
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self._cache_data.items()
+                if current_time - entry.get('timestamp', 0) > expiry_threshold
+            ]
+            
+            for key in expired_keys:
+                del self._cache_data[key]
         
         if expired_keys:
             self._save_cache()
@@ -334,6 +534,27 @@ class CacheManager:
         """Cache file processing result in L1 cache."""
         self.l1_cache.cache_file_result(file_path, result)
     
+    def get_album_scan(self, album_path: Path) -> Optional[AlbumInfo]:
+        """Get an unchanged album's Stage 1 scan from the L1 cache."""
+        return self.l1_cache.get_album_scan(album_path)
+    
+    def cache_album_scan(self, album_info: AlbumInfo):
+        """Cache an album's Stage 1 scan in the L1 cache."""
+        self.l1_cache.cache_album_scan(album_info)
+    
+    def get_album_result(self, album_info: AlbumInfo, settings: str) -> Optional[FinalAlbumInfo]:
+        """Get an unchanged album's final result from the L1 cache."""
+        self.stats['total_requests'] += 1
+        
+        final_info = self.l1_cache.get_album_result(album_info, settings)
+        if final_info is not None:
+            self.stats['l1_hits'] += 1
+        return final_info
+    
+    def cache_album_result(self, album_info: AlbumInfo, settings: str, final_info: FinalAlbumInfo):
+        """Cache an album's final result in the L1 cache."""
+        self.l1_cache.cache_album_result(album_info, settings, final_info)
+    
     def get_api_response(self, prompt: str, model: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Get cached API response from L2 cache."""
         response = self.l2_cache.get_cached_response(prompt, model, **kwargs)
@@ -82,18 +82,21 @@ class AlbumDetector:
             True if audio files are found
         """
         try:
+            # List the directory once; test the extension before stat-ing the entry
+            entries = list(path.iterdir())
+            
             # Check for audio files directly in the directory
-            for file in path.iterdir():
-                if file.is_file() and file.suffix.lower() in self.audio_extensions:
+            for file in entries:
+                if file.suffix.lower() in self.audio_extensions and file.is_file():
                     return True
             
             # Check for audio files in immediate disc subdirectories
-            for subdir in path.iterdir():
-                if (subdir.is_dir() and 
-                    self.disc_dir_pattern.match(subdir.name)):
+            for subdir in entries:
+                if (self.disc_dir_pattern.match(subdir.name) and 
+                    subdir.is_dir()):
                     
                     for file in subdir.iterdir():
-                        if file.is_file() and file.suffix.lower() in self.audio_extensions:
+                        if file.suffix.lower() in self.audio_extensions and file.is_file():
                             return True
             
         except (PermissionError, OSError) as e:
@@ -115,19 +118,21 @@ class AlbumDetector:
         tracks = []
         
         try:
+            entries = sorted(album_dir.iterdir())
+            
             # Get files directly in the album directory
-            for file in sorted(album_dir.iterdir()):
-                if file.is_file() and file.suffix.lower() in self.audio_extensions:
+            for file in entries:
+                if file.suffix.lower() in self.audio_extensions and file.is_file():
                     tracks.append(file)
             
             # Get files from disc subdirectories
-            for subdir in sorted(album_dir.iterdir()):
-                if (subdir.is_dir() and 
-                    self.disc_dir_pattern.match(subdir.name)):
+            for subdir in entries:
+                if (self.disc_dir_pattern.match(subdir.name) and 
+                    subdir.is_dir()):
                     
                     disc_tracks = []
                     for file in sorted(subdir.iterdir()):
-                        if file.is_file() and file.suffix.lower() in self.audio_extensions:
+                        if file.suffix.lower() in self.audio_extensions and file.is_file():
                             disc_tracks.append(file)
                     
                     tracks.extend(disc_tracks)
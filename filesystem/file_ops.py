@@ -10,6 +10,7 @@ import stat
 from pathlib import Path
 from typing import List, Set, Iterator, Optional, Dict, Any
 import logging
+import re
 import mutagen
 from mutagen.id3 import ID3NoHeaderError
 
@@ -19,6 +20,15 @@ from utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Single-pass filename cleanup: invalid characters -> '_', control characters dropped
+SANITIZE_TABLE = str.maketrans({
+    **{c: '_' for c in '<>:"/\\|?*'},
+    **{chr(c): None for c in range(32)},
+})
+
+# Whitespace runs, collapsed to one space by the name cleaners
+WS_RE = re.compile(r'\s+')
+
 
 class FileSystemOperations:
     """Handles all filesystem operations with proper error handling."""
@@ -340,6 +350,9 @@ class FileSystemOperations:
         Returns:
             Sanitized text safe for UTF-8 encoding
         """
+        # ASCII text is always encodable; skip the trial encode
+        if text.isascii():
+            return text
         try:
             # First, try to encode/decode to catch surrogate errors
             text.encode('utf-8')
@@ -347,18 +360,8 @@ class FileSystemOperations:
         except UnicodeEncodeError:
             logger.debug("Found problematic Unicode characters, sanitizing...")
             
-            # Replace or remove problematic characters
-            sanitized_chars = []
-            for char in text:
-                try:
-                    # Test if this character can be encoded
-                    char.encode('utf-8')
-                    sanitized_chars.append(char)
-                except UnicodeEncodeError:
-                    # Replace problematic characters with a safe alternative
-                    sanitized_chars.append('?')
-            
-            return ''.join(sanitized_chars)
+            # Let the codec replace unencodable characters (lone surrogates) with '?'
+            return text.encode('utf-8', errors='replace').decode('utf-8')
     
     def sanitize_filename(self, filename: str, max_length: int = 200) -> str:
         """
@@ -374,13 +377,8 @@ class FileSystemOperations:
         # First sanitize Unicode characters
         filename = self.sanitize_unicode_text(filename)
         
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove control characters
-        filename = ''.join(char for char in filename if ord(char) >= 32)
+        # Replace invalid characters and remove control characters in one pass
+        filename = filename.translate(SANITIZE_TABLE)
         
         # Normalize whitespace
         filename = ' '.join(filename.split())
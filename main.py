@@ -18,10 +18,13 @@ if not os.environ.get('PYTHONUTF8'):
 
 from utils.logging_config import setup_logging
 from utils.config_loader import load_config
-from pipeline.album_orchestrator import AlbumMusicPipeline
+from pipeline.album_orchestrator import AlbumMusicPipeline, load_failed_albums
 from utils.exceptions import MusicOrganizerError
 
 
+MODEL_CHOICES = ["gpt-4o", "gpt-4o-mini", "gpt-5", "gpt-5-mini", "gpt-5-nano", "claude-3-5-sonnet"]
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -33,6 +36,8 @@ Examples:
   %(prog)s /path/to/music --execute          # Execute the organization plan
   %(prog)s /path/to/music --limit 100        # Process only 100 albums for testing
   %(prog)s /path/to/music --no-llm           # Use heuristics only (faster)
+  %(prog)s /path/to/music --no-cache         # Ignore cached LLM responses and album results
+  %(prog)s /path/to/music --retry-failed /path/to/music/_music_claude_output/failed_albums.json
         """
     )
     
@@ -66,27 +71,72 @@ Examples:
         help="Disable LLM classification, use heuristics only"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the LLM instead of reusing cached responses or album results"
+    )
+    
     parser.add_argument(
         "--model",
         type=str,
         default="gpt-5",
-        choices=["gpt-4o", "gpt-4o-mini", "gpt-5", "gpt-5-mini", "gpt-5-nano", "claude-3-5-sonnet"],
+        choices=MODEL_CHOICES,
         help="LLM model to use for classification (default: gpt-5)"
     )
     
+    parser.add_argument(
+        "--extraction-model",
+        type=str,
+        choices=MODEL_CHOICES,
+        help="Model for Stage 2 metadata extraction (default: --model)"
+    )
+    
+    parser.add_argument(
+        "--enrichment-model",
+        type=str,
+        choices=MODEL_CHOICES,
+        help="Model for Stage 3 semantic enrichment (default: --model)"
+    )
+    
+    parser.add_argument(
+        "--single-llm-call",
+        action="store_true",
+        help="Extract and enrich each album with one LLM request instead of two"
+    )
+    
+    parser.add_argument(
+        "--trust-tags",
+        action="store_true",
+        help="Skip the extraction LLM request when embedded tags name the album, artist and year"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose logging"
     )
     
+    parser.add_argument(
+        "--retry-failed",
+        type=Path,
+        metavar="FAILED_JSON",
+        help="Reprocess only the albums listed in a failed_albums.json from an earlier run"
+    )
+    
     parser.add_argument(
         "--output-dir",
         type=Path,
         help="Directory for output files (default: <music_dir>/_music_claude_output)"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # The combined call skips Stage 2, so there is no extraction request for tags to replace
+    if args.single_llm_call and args.trust_tags:
+        parser.error("--trust-tags cannot be combined with --single-llm-call")
+    
+    return args
 
 
 def validate_music_directory(path: Path) -> None:
@@ -121,6 +171,12 @@ def main() -> int:
         # Validate inputs
         validate_music_directory(music_dir)
         
+        retry_albums = None
+        if args.retry_failed:
+            if not args.retry_failed.is_file():
+                raise MusicOrganizerError(f"Failed albums file does not exist: {args.retry_failed}")
+            retry_albums = load_failed_albums(args.retry_failed)
+        
         # Load configuration
         print(f"Loading config from: {config_path}")
         if not config_path.exists():
@@ -138,6 +194,9 @@ def main() -> int:
         logger.info(f"LLM enabled: {not args.no_llm}")
         if not args.no_llm:
             logger.info(f"LLM model: {args.model}")
+            if args.extraction_model or args.enrichment_model:
+                logger.info(f"Stage models: extraction={args.extraction_model or args.model}, "
+                           f"enrichment={args.enrichment_model or args.model}")
         
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -147,14 +206,20 @@ def main() -> int:
             config=config,
             enable_llm=not args.no_llm,
             output_dir=output_dir,
-            model_name=args.model if not args.no_llm else None
+            model_name=args.model if not args.no_llm else None,
+            use_response_cache=not args.no_cache,
+            extraction_model=args.extraction_model,
+            enrichment_model=args.enrichment_model,
+            combine_llm_stages=args.single_llm_call,
+            trust_tags=args.trust_tags
         )
         
         # Process music library
         results = pipeline.process_library(
             music_dir=music_dir,
             limit=args.limit,
-            execute=args.execute
+            execute=args.execute,
+            album_paths=retry_albums
         )
         
         logger.info(f"Processing complete. Processed {results['processed']} albums, "
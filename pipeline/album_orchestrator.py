@@ -6,8 +6,11 @@ reducing API calls and improving classification consistency.
 """
 
 import csv
+import hashlib
+import inspect
 import json
 import logging
+import math
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -20,12 +23,43 @@ from api.schemas import (
 from api.client import ResilientAPIClient
 from filesystem.file_ops import FileSystemOperations
 from filesystem.album_detector import AlbumDetector
-from pipeline.album_stages import AlbumStage1Analysis, AlbumStage2Extraction, AlbumStage3Enrichment, AlbumStage4Canonicalization
+from pipeline.album_stages import (
+    AlbumStage1Analysis, AlbumStage2Extraction, AlbumStage3Enrichment, AlbumStage23Combined,
+    AlbumStage4Canonicalization
+)
 from caching.cache_manager import CacheManager
 from utils.exceptions import MusicOrganizerError, FileProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Pipeline stages in execution order, for timing reports
+_STAGE_NAMES = ('stage1', 'stage2', 'stage3', 'stage2+3', 'stage4')
+
+
+def _album_rules_fingerprint() -> str:
+    """
+    Hash the album stage and schema sources for the cached album result fingerprint.
+    
+    Any edit to the prompts, classification rules, path rules or result schema
+    changes the hash, so results cached under the old rules are recomputed.
+    """
+    digest = hashlib.sha256()
+    for rules_owner in (AlbumStage4Canonicalization, FinalAlbumInfo):
+        digest.update(Path(inspect.getsourcefile(rules_owner)).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def load_failed_albums(failed_file: Path) -> List[Path]:
+    """Read the album paths listed in a failed_albums.json written by an earlier run."""
+    with open(failed_file, 'r', encoding='utf-8') as f:
+        failed = json.load(f)
+    return [Path(entry['album_path']) for entry in failed if entry.get('album_path')]
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
 
 class AlbumMusicPipeline:
     """
@@ -37,14 +71,28 @@ class AlbumMusicPipeline:
         config: Dict[str, Any], 
         enable_llm: bool = True,
         output_dir: Path = None,
-        model_name: str = None
+        model_name: str = None,
+        use_response_cache: bool = True,
+        extraction_model: str = None,
+        enrichment_model: str = None,
+        combine_llm_stages: bool = False,
+        trust_tags: bool = False
     ):
         """Initialize the album-level music processing pipeline."""
         self.config = config
         self.enable_llm = enable_llm
+        self.use_result_cache = use_response_cache
         self.output_dir = output_dir or Path.cwd()
         self.model_name = model_name or config['api'].get('openai_model_extraction', 'gpt-5')
         
+        # Stage 2 is mechanical JSON extraction and can run on a cheaper model than
+        # Stage 3's semantic enrichment; per-stage overrides win over model_name
+        self.extraction_model = extraction_model or self.model_name
+        self.enrichment_model = (
+            enrichment_model or model_name
+            or config['api'].get('openai_model_enrichment', self.model_name)
+        )
+        
         # Initialize components
         self.filesystem_ops = FileSystemOperations(
             audio_extensions=config['filesystem']['audio_extensions'],
@@ -56,38 +104,59 @@ class AlbumMusicPipeline:
             ignored_dirs=config['filesystem']['ignored_dirs']
         )
         
+        self.cache_manager = CacheManager(
+            execution_cache_file=Path(config['caching']['execution_cache_file']).expanduser(),
+            api_cache_file=Path(config['caching']['api_cache_file']).expanduser(),
+            expiry_days=config['caching']['cache_expiry_days']
+        )
+        
         if enable_llm:
             self.api_client = ResilientAPIClient(
                 max_retries=config['api']['max_retries'],
-                timeout=config['api']['timeout_seconds']
+                timeout=config['api']['timeout_seconds'],
+                max_concurrent_requests=config['concurrency'].get('api_concurrency'),
+                response_cache=self.cache_manager if use_response_cache else None
             )
         else:
             self.api_client = None
         
-        self.cache_manager = CacheManager(
-            execution_cache_file=Path(config['caching']['execution_cache_file']).expanduser(),
-            api_cache_file=Path(config['caching']['api_cache_file']).expanduser(),
-            expiry_days=config['caching']['cache_expiry_days']
-        )
-        
         # Initialize pipeline stages
-        self.stage1 = AlbumStage1Analysis(self.filesystem_ops, self.album_detector)
+        self.stage1 = AlbumStage1Analysis(
+            self.filesystem_ops, self.album_detector, scan_cache=self.cache_manager
+        )
         
         if enable_llm:
+            # trust_tags lets well-tagged albums skip the extraction request
             self.stage2 = AlbumStage2Extraction(
                 self.api_client, 
-                self.model_name
+                self.extraction_model,
+                trust_tags=trust_tags
             )
             self.stage3 = AlbumStage3Enrichment(
                 self.api_client, 
-                self.model_name
+                self.enrichment_model
+            )
+            # One request per album instead of two; the enrichment model answers both
+            self.stage23 = (
+                AlbumStage23Combined(self.stage2, self.enrichment_model)
+                if combine_llm_stages else None
             )
         else:
             self.stage2 = None
             self.stage3 = None
+            self.stage23 = None
             
         self.stage4 = AlbumStage4Canonicalization()
         
+        # Cached album results are only reused when produced under the same settings
+        self.result_cache_settings = json.dumps([
+            _album_rules_fingerprint(),
+            self.extraction_model,
+            self.enrichment_model,
+            combine_llm_stages,
+            trust_tags
+        ])
+        
         # Configuration for organization
         self.top_buckets = config['categories']['top_buckets']
         self.soundtrack_subs = config['categories']['soundtrack_subs']
@@ -107,7 +176,8 @@ class AlbumMusicPipeline:
         self, 
         music_dir: Path, 
         limit: Optional[int] = None,
-        execute: bool = False
+        execute: bool = False,
+        album_paths: Optional[List[Path]] = None
     ) -> Dict[str, int]:
         """
         Process an entire music library at the album level.
@@ -116,6 +186,8 @@ class AlbumMusicPipeline:
             music_dir: Root directory of the music library
             limit: Optional limit on number of albums to process
             execute: Whether to execute the organization plan
+            album_paths: Process only these albums instead of discovering them
+                (e.g. the entries of a failed_albums.json)
             
         Returns:
             Dictionary with processing statistics
@@ -123,9 +195,13 @@ class AlbumMusicPipeline:
         logger.info(f"Starting album-level music library processing: {music_dir}")
         start_time = time.time()
         
-        # Discover albums
-        logger.info("Discovering albums...")
-        albums = self.album_detector.discover_albums(music_dir)
+        if album_paths is not None:
+            albums = list(album_paths)
+            logger.info(f"Retrying {len(albums)} listed albums")
+        else:
+            # Discover albums
+            logger.info("Discovering albums...")
+            albums = self.album_detector.discover_albums(music_dir)
         
         if limit:
             albums = albums[:limit]
@@ -143,6 +219,9 @@ class AlbumMusicPipeline:
         else:
             results = self._process_albums_sequential(albums)
         
+        # Persist responses cached since the last periodic save
+        self.cache_manager.force_save_all()
+        
         # Generate outputs
         self._generate_output_files(results)
         
@@ -156,7 +235,7 @@ class AlbumMusicPipeline:
         # Calculate statistics
         successful = sum(1 for r in results if r.success)
         failed = len(results) - successful
-        total_tracks = sum(r.album_info.track_count for r in results)
+        total_tracks = sum(r.album_info.track_count for r in results if r.album_info)
         
         # Estimate API calls saved
         api_calls_saved = total_tracks - len([r for r in results if r.success])
@@ -188,52 +267,64 @@ class AlbumMusicPipeline:
             AlbumProcessingResult with the outcome
         """
         start_time = time.time()
+        stage_timings = {}
         
         try:
             logger.debug(f"Processing album: {album_path}")
             
             # Stage 1: Album Analysis
-            album_info = self.stage1.process(album_path)
+            album_info = self._run_stage(stage_timings, 'stage1', self.stage1.process, album_path)
             if album_info is None:
                 logger.debug(f"Album skipped in Stage 1: {album_path}")
                 return AlbumProcessingResult(
                     album_info=None,
+                    album_path=album_path,
                     success=False,
                     final_album_info=None,
                     error_message="Album skipped (no audio files or other reason)",
                     processing_time_seconds=time.time() - start_time,
-                    pipeline_stage_completed="stage1"
+                    pipeline_stage_completed="stage1",
+                    stage_timings=stage_timings
                 )
             
-            # Check cache first (using album path as key)
-            cache_key = str(album_path)
-            if self.cache_manager.is_file_cached(album_path):
+            if not self.enable_llm:
+                # Fallback to heuristic processing
+                return self._process_album_with_heuristics(album_info, start_time, stage_timings)
+            
+            # Reuse the final result of an unchanged album
+            cached_info = (
+                self.cache_manager.get_album_result(album_info, self.result_cache_settings)
+                if self.use_result_cache else None
+            )
+            if cached_info is not None:
                 logger.debug(f"Album found in cache, skipping: {album_path}")
                 self.stats['cache_hits'] += 1
                 return AlbumProcessingResult(
                     album_info=album_info,
                     success=True,
-                    final_album_info=None,  # Would load from cache in full implementation
+                    final_album_info=cached_info,
                     error_message=None,
                     processing_time_seconds=time.time() - start_time,
-                    pipeline_stage_completed="cached"
+                    pipeline_stage_completed="cached",
+                    stage_timings=stage_timings
                 )
             
-            if not self.enable_llm:
-                # Fallback to heuristic processing
-                return self._process_album_with_heuristics(album_info, start_time)
-            
-            # Stage 2: Structured Data Extraction
-            extracted_info = self.stage2.process(album_info)
-            
-            # Stage 3: Semantic Enrichment
-            enriched_info = self.stage3.process(extracted_info)
+            if self.stage23:
+                # Stages 2+3: Extraction and Enrichment in a single LLM call
+                enriched_info = self._run_stage(stage_timings, 'stage2+3', self.stage23.process, album_info)
+            else:
+                # Stage 2: Structured Data Extraction
+                extracted_info = self._run_stage(stage_timings, 'stage2', self.stage2.process, album_info)
+                
+                # Stage 3: Semantic Enrichment
+                enriched_info = self._run_stage(stage_timings, 'stage3', self.stage3.process, extracted_info)
             
             # Stage 4: Canonicalization & Organization
-            final_info = self.stage4.process(enriched_info, album_info)
+            final_info = self._run_stage(stage_timings, 'stage4', self.stage4.process, enriched_info, album_info)
             
             # Cache the result
-            # self.cache_manager.cache_file_result(album_path, final_info)  # Would need to adapt for albums
+            if self.use_result_cache:
+                self.cache_manager.cache_album_result(album_info, self.result_cache_settings, final_info)
             
             processing_time = time.time() - start_time
             self.stats['albums_processed'] += 1
@@ -245,7 +336,8 @@ class AlbumMusicPipeline:
                 final_album_info=final_info,
                 error_message=None,
                 processing_time_seconds=processing_time,
-                pipeline_stage_completed="stage4"
+                pipeline_stage_completed="stage4",
+                stage_timings=stage_timings
             )
         
         except Exception as e:
@@ -256,13 +348,23 @@ class AlbumMusicPipeline:
             
             return AlbumProcessingResult(
                 album_info=album_info if 'album_info' in locals() else None,
+                album_path=album_path,
                 success=False,
                 final_album_info=None,
                 error_message=error_msg,
                 processing_time_seconds=time.time() - start_time,
-                pipeline_stage_completed="error"
+                pipeline_stage_completed="error",
+                stage_timings=stage_timings
             )
     
+    def _run_stage(self, stage_timings: Dict[str, float], stage_name: str, stage_fn, *args):
+        """Run one pipeline stage, recording its wall time even when it fails."""
+        stage_start = time.time()
+        try:
+            return stage_fn(*args)
+        finally:
+            stage_timings[stage_name] = time.time() - stage_start
+    
     def _process_albums_sequential(self, album_paths: List[Path]) -> List[AlbumProcessingResult]:
         """Process albums sequentially."""
         results = []
@@ -279,6 +381,14 @@ class AlbumMusicPipeline:
     def _process_albums_concurrent(self, album_paths: List[Path]) -> List[AlbumProcessingResult]:
         """Process albums concurrently using ThreadPoolExecutor."""
         max_workers = self.config['concurrency']['max_workers']
+        
+        # Each worker has at most one LLM request on the wire, so extra request slots go unused
+        api_concurrency = self.config['concurrency'].get('api_concurrency', 1)
+        if self.enable_llm and api_concurrency > max_workers:
+            logger.warning(
+                f"concurrency.api_concurrency ({api_concurrency}) exceeds max_workers ({max_workers}); "
+                f"raise max_workers to keep more API requests in flight"
+            )
         results = []
         
         logger.info(f"Processing {len(album_paths)} albums with {max_workers} workers")
@@ -302,7 +412,8 @@ class AlbumMusicPipeline:
         
         return results
     
-    def _process_album_with_heuristics(self, album_info: AlbumInfo, start_time: float) -> AlbumProcessingResult:
+    def _process_album_with_heuristics(self, album_info: AlbumInfo, start_time: float,
+                                       stage_timings: Optional[Dict[str, float]] = None) -> AlbumProcessingResult:
         """Process album using heuristics when LLM is disabled."""
         
         # Simple heuristic classification based on folder names
@@ -352,13 +463,17 @@ class AlbumMusicPipeline:
             final_album_info=final_info,
             error_message=None,
             processing_time_seconds=time.time() - start_time,
-            pipeline_stage_completed="heuristic"
+            pipeline_stage_completed="heuristic",
+            stage_timings=stage_timings or {}
         )
     
     def _generate_output_files(self, results: List[AlbumProcessingResult]):
         """Generate output files with album processing results."""
         logger.info("Generating output files...")
 
+        # Record failures first so they are kept even when nothing succeeded
+        self._generate_failed_albums_log(results)
+
         successful_results = [r for r in results if r.success and r.final_album_info]
 
         if not successful_results:
@@ -383,6 +498,28 @@ class AlbumMusicPipeline:
         # Generate comprehensive statistics
         self._generate_comprehensive_stats(results)
     
+    def _generate_failed_albums_log(self, results: List[AlbumProcessingResult]):
+        """Write failed albums to a dead-letter file so they can be retried on their own."""
+        failed = [
+            {
+                'album_path': str(r.album_path or (r.album_info.album_path if r.album_info else '')),
+                'stage': r.pipeline_stage_completed,
+                'error': r.error_message
+            }
+            for r in results if not r.success
+        ]
+        
+        failed_file = self.output_dir / "failed_albums.json"
+        if not failed:
+            # Don't leave a stale list from an earlier run behind
+            failed_file.unlink(missing_ok=True)
+            return
+        
+        with open(failed_file, 'w', encoding='utf-8') as f:
+            json.dump(failed, f, indent=2, ensure_ascii=False)
+        
+        logger.info(f"{len(failed)} failed albums saved to: {failed_file}")
+    
     def _generate_album_directory_tree(self, results: List[AlbumProcessingResult]):
         """Generate a tree-like directory structure preview for albums."""
         logger.info("Generating album directory tree preview...")
@@ -787,6 +924,18 @@ class AlbumMusicPipeline:
             
             albums_per_minute = (len(successful) / (total_time / 60)) if total_time > 0 else 0
             f.write(f"Processing Rate: {albums_per_minute:.1f} albums/minute\n")
+            
+            # Per-stage latency, to show whether disk scans or LLM round-trips dominate
+            stage_times = {stage: sorted(r.stage_timings[stage] for r in results if stage in r.stage_timings)
+                           for stage in _STAGE_NAMES}
+            if any(stage_times.values()):
+                f.write("\n⏱️ STAGE TIMINGS\n")
+                f.write("-" * 25 + "\n")
+                for stage, times in stage_times.items():
+                    if times:
+                        f.write(f"   • {stage}: {len(times)} runs, total {sum(times):.1f}s, "
+                                f"p50 {_percentile(times, 0.5):.2f}s, p95 {_percentile(times, 0.95):.2f}s, "
+                                f"max {times[-1]:.2f}s\n")
         
         # Print key stats to console  
         print(f"\n📊 PROCESSING STATISTICS")
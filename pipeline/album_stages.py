@@ -5,8 +5,11 @@ This module implements the four-stage pipeline at the album level with comprehen
 classification rules, normalization, and quality gates.
 """
 
+import functools
 import logging
 import re
+import unicodedata
+from collections import Counter
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
@@ -15,7 +18,7 @@ from api.schemas import (
     AlbumInfo, ExtractedAlbumInfo, EnrichedAlbumInfo, FinalAlbumInfo
 )
 from api.client import ResilientAPIClient
-from filesystem.file_ops import FileSystemOperations
+from filesystem.file_ops import FileSystemOperations, SANITIZE_TABLE, WS_RE
 from filesystem.album_detector import AlbumDetector
 from utils.exceptions import (
     FileProcessingError, UnsupportedFormatError, MetadataExtractionError,
@@ -31,14 +34,237 @@ FORMAT_SERIES_DIRS = {
     'max mix', 'jvc xrcd', 'sampler'
 }
 
+# Known album series, tried in priority order against the lowercased album title
+_SERIES_PATTERNS = tuple(
+    (series_name, re.compile(pattern)) for series_name, pattern in (
+        ('Best Audiophile Voices', r'best audiophile voices'),
+        ('Audiophile Reference', r'audiophile reference'),
+        ('Super Analog Sound', r'super analog sound'),
+        ('The Best Of', r'the best of\s+\w+'),
+        ('The Essential Collection', r'the essential collection'),
+        ('The Complete Mike Oldfield', r'the complete mike oldfield'),
+        ('Super Sound', r'super sound\s*(vol|volume)?'),
+        ('Three Blind Mice', r'(three blind mice|tbm|the super .* sound of tbm)'),
+        ('The Best Songs Of The World', r'the best songs of the world'),
+        ('Max Mix', r'max mix'),
+        ('JVC XRCD', r'jvc xrcd\d*\s*(sampler|audiophile|collection)'),
+        ('XRCD Sampler', r'xrcd\d*\s*sampler'),
+    )
+)
+
+# Bracketed or parenthesized format indicators stripped from canonical titles
+_FORMAT_BRACKET_RE = re.compile(
+    r'\[(?:FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|24-\d+|SHM-CD)\]'
+    r'|\((?:FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|24-\d+|SHM-CD)\)',
+    re.IGNORECASE
+)
+
+# Audiophile format tags, matched in a single scan; each named group maps to its tag
+_FORMAT_TAG_BY_GROUP = {
+    'xrcd24': 'XRCD24',
+    'xrcd': 'XRCD',
+    'k2hd': 'K2HD',
+    'shmcd': 'SHM-CD',
+    'mfsl': 'MFSL',
+    'sacd': 'SACD',
+    'dsd': 'DSD',
+    'hr_24_96': '24-96',
+    'hr_24_88': '24-88',
+    'hr_24_192': '24-192',
+}
+_FORMAT_TAGS_RE = re.compile(
+    r'\b(?:(?P<xrcd24>XRCD24)'
+    r'|(?P<xrcd>XRCD)'
+    r'|(?P<k2hd>K2HD)'
+    r'|(?P<shmcd>SHM-?CD)'
+    r'|(?P<mfsl>MFSL|Mobile Fidelity)'
+    r'|(?P<sacd>SACD)'
+    r'|(?P<dsd>DSD)'
+    r'|(?P<hr_24_96>24[-/]96)'
+    r'|(?P<hr_24_88>24[-/]88)'
+    r'|(?P<hr_24_192>24[-/]192))\b',
+    re.IGNORECASE
+)
+
+# Stage 2 cleanup of LLM-extracted artist/title strings
+_FORMAT_TAG_SUFFIX_RE = re.compile(r'\[(XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\].*$')
+_NAME_LIKE_RE = re.compile(r'[A-Z][a-z]+ [A-Z]')
+_ARTIST_SEPARATOR_RE = re.compile(r'\s*[,/]\s*')
+_TITLE_FORMAT_TAG_RES = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\[(FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\]',
+        r'\((FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\)',
+        r'[-_]\s*(FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\s*$',
+    )
+)
+
+# CJK scripts: Hiragana/Katakana, CJK Unified Ideographs, Hangul syllables
+_CJK_RE = re.compile('[\u3040-\u30ff\u4e00-\u9fff\uac00-\ud7af]')
+
+# Volume/part number patterns, tried in priority order: "Vol. 3"/"Volume IV", "Part 2", trailing number
+_VOLUME_PATTERNS = (
+    re.compile(r'[Vv]ol(?:ume)?\.?\s*(\d+|[IVX]+)'),
+    re.compile(r'[Pp]art\s*(\d+|[IVX]+)'),
+    re.compile(r'(\d+|[IVX]+)\s*$'),
+)
+
+# Four-digit release year inside a tag date ('1959', '1959-08-17', '2003/05')
+_TAG_YEAR_RE = re.compile(r'\b(1[89]\d\d|20\d\d)\b')
+
+# Combining diacritical marks, stripped after NFKD decomposition ('misérables' -> 'miserables')
+_STRIP_COMBINING = str.maketrans('', '', ''.join(chr(c) for c in range(0x300, 0x370)))
+
+def _fold_diacritics(text: str) -> str:
+    """Strip diacritics so keyword checks only need the ASCII spelling."""
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFKD', text).translate(_STRIP_COMBINING)
+
+# Shared (top_category, sub_category, composer) classification results
+_SOUND_STAGE = ("Soundtracks", "Stage & Musicals", None)
+_SOUND_GAME = ("Soundtracks", "Game", None)
+_SOUND_TV = ("Soundtracks", "TV", None)
+_SOUND_FILM = ("Soundtracks", "Film", None)
+_CLASSICAL_RECITALS = ("Classical", "Recitals", None)
+_COMP_VA = ("Compilations & VA", None, None)
+_LIBRARY = ("Library", None, None)
+_JAZZ = ("Jazz", None, None)
+_ELECTRONIC = ("Electronic", None, None)
+
+@functools.lru_cache(maxsize=256)
+def _series_name_re(series_name: str) -> re.Pattern:
+    """Case-insensitive literal matcher for a series name, compiled once per series."""
+    return re.compile(re.escape(series_name), re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def _composer_prefix_re(composer: str) -> re.Pattern:
+    """Matcher for a "Composer:" mention in a work title, compiled once per composer."""
+    return re.compile(f"{re.escape(composer)}:?\\s*", re.IGNORECASE)
+
+def _keyword_union(terms: List[str]) -> re.Pattern:
+    """Compile a list of literal keywords into one substring-matching alternation."""
+    return re.compile('|'.join(re.escape(t) for t in terms))
+
+# Genre/title keyword groups used by album classification, one scan per group
+_SOUNDTRACK_CUES_RE = _keyword_union([
+    'soundtrack', 'score', 'film music', 'game music', 'ost',
+    'original motion picture', 'music from', 'original soundtrack',
+    # Anime/Studio Ghibli cues should also trigger soundtrack routing
+    'anime', 'ghibli', 'studio ghibli', 'on your mark'
+])
+_CLASSICAL_GENRE_RE = _keyword_union([
+    'classical', 'symphony', 'symphonic', 'concerto', 'opera', 'chamber',
+    'orchestral', 'baroque', 'romantic', 'modern classical', 'sonata',
+    'suite', 'overture', 'requiem', 'mass', 'cantata', 'fugue'
+])
+_JAZZ_GENRE_RE = _keyword_union([
+    'jazz', 'blues', 'swing', 'bebop', 'fusion', 'smooth jazz',
+    'cool jazz', 'free jazz', 'hard bop', 'latin jazz'
+])
+_ELECTRONIC_GENRE_RE = _keyword_union([
+    'electronic', 'techno', 'house', 'ambient', 'edm', 'synth',
+    'electro', 'trance', 'dubstep', 'drum and bass', 'dnb',
+    'breakbeat', 'downtempo', 'chillout', 'idm'
+])
+
+# Soundtrack sub-category cues, searched in genres + album title
+_STAGE_CUES_RE = _keyword_union([
+    'musical', 'broadway', 'cast recording', 'royal albert hall',
+    'staged concert', 'les miserables', 'cirque du soleil'
+])
+_GAME_CUES_RE = _keyword_union(['game', 'video game', 'halo', 'zelda', 'nintendo'])
+_TV_CUES_RE = _keyword_union(['tv', 'television', 'hbo', 'netflix', 'season'])
+
+# Compilation detection: explicit multi-artist wording, always-compilation series,
+# and collection titles that may belong to a single artist
+_VA_TITLE_RE = _keyword_union(['various artists', 'va', 'sampler', 'label sampler', 'multi-artist'])
+_VA_ARTIST_RE = _keyword_union(['various artists', 'va'])
+_COMPILATION_SERIES_RE = _keyword_union([
+    'best audiophile voices', 'audiophile reference', 'super analog sound',
+    'xrcd sampler', 'test cd', 'demo disc', 'audiophile test'
+])
+_COLLECTION_TITLE_RE = _keyword_union([
+    'greatest hits', 'best of', 'collection', 'anthology', 'essential', 'essentials',
+    'ultimate', 'gold', 'platinum', 'complete'
+])
+
+# Jazz label/series hints found in folder and album names
+_JAZZ_LABEL_RE = _keyword_union([
+    'blue note', 'prestige', 'riverside', 'contemporary', 'tbm', 'three blind mice',
+    'dcc', 'audio wave'
+])
+
+# Known electronic artists
+_ELECTRONIC_ARTISTS_RE = _keyword_union([
+    'jean-michel jarre', 'jean michel jarre', 'daft punk', 'kitaro',
+    'carpenter brut', 'kraftwerk', 'tangerine dream', 'vangelis', 'magic sword',
+    'deadmau5', 'aphex twin', 'boards of canada', 'massive attack'
+])
+
+# Quality-gate keyword groups
+_DISNEY_RE = _keyword_union([
+    'disney', 'aladdin', 'little mermaid', 'lion king',
+    'beauty and the beast', 'frozen', 'moana', 'tangled'
+])
+_POP_ROCK_ARTISTS_RE = _keyword_union([
+    'beach boys', 'emerson lake palmer', 'elp', 'yes', 'genesis',
+    'pink floyd', 'led zeppelin', 'queen', 'beatles', 'rolling stones',
+    'adele', 'santana', 'muse', 'dire straits', 'steely dan'
+])
+_GAME_TITLES_RE = _keyword_union(['halo', 'zelda', 'mario', 'final fantasy', 'pokemon', 'nintendo'])
+_FAMOUS_GAMES_RE = _keyword_union(['zelda', 'halo', 'mario', 'final fantasy'])
+_CURE_ALBUMS_RE = _keyword_union([
+    'staring at the sea', 'kiss me kiss me', 'seventeen seconds',
+    'disintegration', 'pornography', 'head on the door'
+])
+_JAZZ_ARTISTS_RE = _keyword_union([
+    'bill evans', 'miles davis', 'john coltrane', 'cannonball adderley',
+    'chet baker', 'sonny rollins', 'thelonious monk', 'art blakey',
+    'horace silver', 'kenny dorham', 'lee morgan', 'hank mobley',
+    'johnny coles', 'little johnny c'
+])
+_CLASSICAL_FORMS_RE = _keyword_union(['sonata', 'concerto', 'symphony', 'quartet', 'quintet'])
+_SOLO_HITS_ARTISTS_RE = _keyword_union(['queen', 'tina turner', 'steely dan', 'dire straits'])
+_CELTIC_RE = _keyword_union(['kerry dancers', 'irish', 'celtic', 'gaelic'])
+_SCORE_WORDS_RE = _keyword_union(['soundtrack', 'score', 'ost'])
+
+# Title words that mark a Joe Hisaishi album as Studio Ghibli
+_HISAISHI_GHIBLI_RE = _keyword_union(['my neighbor', 'castle', 'princess'])
+
+# Explicit soundtrack wording in a title, used to veto quality-gate reroutes
+_SOUNDTRACK_MENTION_RE = _keyword_union(['soundtrack', 'ost', 'score', 'music from'])
+
+# Test/demo discs that belong with compilations regardless of genre
+_TEST_DISC_RE = re.compile(
+    r'film music and special effects'
+    r'|\b(?:test cd|audiophile test|test disc|test\b)'
+    r'|\b(?:demo disc|demo cd|demo)\b'
+)
+
+# Classical work catalogue numbers (Op., BWV, K./KV, RV, No.)
+_CLASSICAL_WORK_RE = re.compile(
+    r'\bOp\.\s*\d+|\bBWV\s*\d+|\bK\.\s*\d+|\bKV\s*\d+|\bRV\s*\d+|No\.\s*\d+', re.IGNORECASE
+)
+
 def _normalized_parents(parents: List[str]) -> List[str]:
     """Normalize parent directory names and drop known format/series folders."""
     def clean(p: str) -> str:
-        q = p.lower().strip().strip(" []()._-")
-        return q
+        return p.lower().strip().strip(" []()._-")
     return [p for p in (clean(x) for x in parents) if p and p not in FORMAT_SERIES_DIRS]
 
 
+def _build_alias_lookup(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map every lowercased canonical name and alias to its canonical name.
+
+    Earlier entries win on collisions, matching a first-match scan of the table.
+    """
+    lookup = {}
+    for canonical, names in aliases.items():
+        for alias in (canonical, *names):
+            lookup.setdefault(alias.lower(), canonical)
+    return lookup
+
+
 @dataclass
 class ComposerAliases:
     """Canonical composer names and their aliases."""
@@ -59,21 +285,18 @@ class ComposerAliases:
         "Antonín Dvořák": ["Dvorak", "A. Dvorak", "A. Dvořák"],
         "Nikolai Rimsky-Korsakov": ["Rimsky-Korsakov", "N. Rimsky-Korsakov"],
     }
+    _lookup = _build_alias_lookup(aliases)
     
     @classmethod
     def get_canonical_name(cls, name: str) -> str:
         """Return canonical composer name if found in aliases."""
-        name_lower = name.lower().strip()
-        for canonical, aliases in cls.aliases.items():
-            if name_lower == canonical.lower() or any(name_lower == alias.lower() for alias in aliases):
-                return canonical
-        return name
+        return cls._lookup.get(name.lower().strip(), name)
     
 @dataclass
 class ArtistAliases:
     """Canonical artist names and their aliases for non-classical artists."""
     aliases = {
-        "Jean-Michel Jarre": ["Jean Michel Jarre", "Jean Michel Jarre", "J.M. Jarre", "JM Jarre"],
+        "Jean-Michel Jarre": ["Jean Michel Jarre", "J.M. Jarre", "JM Jarre"],
         "Mecano": ["Ana José Nacho", "Ana-Jose-Nacho", "Ana Jose Nacho"],
         "The Cure": ["Cure", "The Cure"],
         "Arne Domnérus": ["Arne Domnerus", "Domnerus"],
@@ -81,15 +304,12 @@ class ArtistAliases:
         "Emerson, Lake & Palmer": ["ELP", "Emerson Lake and Palmer", "Emerson, Lake and Palmer"],
         "Bill Evans": ["William Evans", "Bill Evans Trio"],
     }
+    _lookup = _build_alias_lookup(aliases)
     
     @classmethod
     def get_canonical_name(cls, name: str) -> str:
         """Return canonical artist name if found in aliases."""
-        name_lower = name.lower().strip()
-        for canonical, aliases in cls.aliases.items():
-            if name_lower == canonical.lower() or any(name_lower == alias.lower() for alias in aliases):
-                return canonical
-        return name
+        return cls._lookup.get(name.lower().strip(), name)
 
 
 @dataclass 
@@ -103,23 +323,26 @@ class OrchestraAliases:
         "Berlin Philharmonic": ["BPO", "Berliner Philharmoniker", "Berlin Phil"],
         "Vienna Philharmonic": ["VPO", "Wiener Philharmoniker", "Vienna Phil"],
     }
+    _lookup = _build_alias_lookup(aliases)
     
     @classmethod
     def get_canonical_name(cls, name: str) -> str:
         """Return canonical orchestra name if found in aliases."""
-        name_lower = name.lower().strip()
-        for canonical, aliases in cls.aliases.items():
-            if name_lower == canonical.lower() or any(name_lower == alias.lower() for alias in aliases):
-                return canonical
-        return name
+        return cls._lookup.get(name.lower().strip(), name)
 
 
 class AlbumStage1Analysis:
     """Stage 1: Album Analysis & Metadata Sampling."""
     
-    def __init__(self, filesystem_ops: FileSystemOperations, album_detector: AlbumDetector):
+    # Tag fields worth carrying into the extraction prompt
+    SAMPLED_METADATA_FIELDS = ('artist', 'albumartist', 'album', 'date', 'year', 'genre')
+    
+    def __init__(self, filesystem_ops: FileSystemOperations, album_detector: AlbumDetector,
+                 scan_cache=None):
         self.filesystem_ops = filesystem_ops
         self.album_detector = album_detector
+        # Optional CacheManager; unchanged albums skip the track walk and tag reads
+        self.scan_cache = scan_cache
     
     def process(self, album_path: Path) -> Optional[AlbumInfo]:
         """
@@ -132,7 +355,12 @@ class AlbumStage1Analysis:
             AlbumInfo object with analyzed album data
         """
         try:
-            logger.debug(f"Album Stage 1: Analyzing {album_path}")
+            logger.debug("Album Stage 1: Analyzing %s", album_path)
+            
+            if self.scan_cache:
+                cached_info = self.scan_cache.get_album_scan(album_path)
+                if cached_info is not None:
+                    return cached_info
             
             # Get basic album structure
             album_structure = self.album_detector.analyze_album_structure(album_path)
@@ -144,7 +372,7 @@ class AlbumStage1Analysis:
             # Sample metadata from a few tracks
             sample_metadata = self._sample_track_metadata(album_structure['track_paths'][:3])
             
-            return AlbumInfo(
+            album_info = AlbumInfo(
                 album_path=album_structure['album_path'],
                 album_name=album_structure['album_name'],
                 parent_dirs=album_structure['parent_dirs'],
@@ -157,6 +385,11 @@ class AlbumStage1Analysis:
                 sample_metadata=sample_metadata
             )
             
+            if self.scan_cache:
+                self.scan_cache.cache_album_scan(album_info)
+            
+            return album_info
+            
         except Exception as e:
             raise FileProcessingError(f"Album Stage 1 failed for {album_path}: {e}")
     
@@ -169,25 +402,20 @@ class AlbumStage1Analysis:
                 metadata = self.filesystem_ops.extract_metadata(track_path)
                 
                 # Collect common fields
-                for field in ['artist', 'albumartist', 'album', 'date', 'year', 'genre']:
-                    if field in metadata and metadata[field]:
-                        if field not in combined_metadata:
-                            combined_metadata[field] = []
-                        combined_metadata[field].append(metadata[field])
+                for field in self.SAMPLED_METADATA_FIELDS:
+                    value = metadata.get(field)
+                    if value:
+                        combined_metadata.setdefault(field, []).append(value)
                 
             except Exception as e:
-                logger.debug(f"Could not extract metadata from {track_path}: {e}")
+                logger.debug("Could not extract metadata from %s: %s", track_path, e)
                 continue
         
-        # Consolidate repeated values
-        consolidated = {}
-        for field, values in combined_metadata.items():
-            # Find most common value
-            if values:
-                most_common = max(set(values), key=values.count)
-                consolidated[field] = most_common
-        
-        return consolidated
+        # Consolidate repeated values: most common wins, ties go to the first track seen
+        return {
+            field: Counter(values).most_common(1)[0][0]
+            for field, values in combined_metadata.items()
+        }
 
 
 class AlbumStage2Extraction:
@@ -224,24 +452,74 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
    - Keep discs together under same album folder: .../ALBUM - YEAR/[CD1], [CD2], ...
 """
     
-    def __init__(self, api_client: ResilientAPIClient, model_name: str):
+    # Album-independent instructions, sent as the system message so every extraction
+    # request shares one cacheable prefix; the user message carries only the album
+    SYSTEM_PROMPT = """
+Extract album information from the music collection described in the user message, following these normalization rules:
+""" + COMPREHENSIVE_RULES + """
+Common folder naming patterns to parse (check these patterns in order):
+1. "Artist - Album Title" (most common)
+2. "Album Title - Artist" (check if second part looks like artist/band/orchestra name)
+3. "Artist - Album Title - Year"
+4. "Album Title - Artist & Orchestra/Conductor [Format]"
+5. For classical: "Work Title - Performer(s) [Format]"
+6. Just "Album Title" with no artist
+
+Examples of pattern #2 and #4 (Album - Artist):
+- "La Folia de la Spagna - Paniagua & Atrium Musicae de Madrid [XRCD24]" → Artist: "Paniagua & Atrium Musicae de Madrid", Album: "La Folia de la Spagna"
+- "The Four Seasons - Salvatore Accardo [XRCD]" → Artist: "Salvatore Accardo", Album: "The Four Seasons"
+- "Carmina Burana - Boston Symphony Orchestra [SACD]" → Artist: "Boston Symphony Orchestra", Album: "Carmina Burana"
+
+Extract and normalize the following album information:
+- artist: The primary album artist or band name (check folder name patterns above, use "Unknown Artist" if unable to determine)
+- album_title: The album title (remove format tags, clean spacing, preserve diacritics, use "Unknown Album" if unable to determine)
+- year: Album release year if found (4-digit number), or null if not found  
+- total_tracks: Confirm the total number of tracks given in the user message
+- disc_count: Number of discs (1 for single disc, otherwise the disc count given in the user message)
+
+Important parsing rules:
+- First check if the folder name contains a dash (-) separator
+- If text after the dash contains orchestra/ensemble/band names or performer names, it's likely the artist
+- Words like "Orchestra", "Ensemble", "Quartet", "Trio", "Band", "& His", "& The" often indicate artist names
+- For classical albums, if you see performer names after the work title, extract them as the artist
+- If the album has Chinese/Japanese/Korean characters and you cannot determine the artist/title, use "Unknown Artist" / "Unknown Album"
+- For classical music, identify the COMPOSER as the primary artist if it's a single-composer album
+- For soundtracks, keep the film/show/game title as the album title, not the composer
+- Apply all normalization rules strictly
+- Never return null for artist or album_title fields
+"""
+    
+    # Tracks listed individually in the extraction prompt
+    PROMPT_TRACK_LIMIT = 10
+    
+    # Common indicators that text is an artist/performer name
+    ARTIST_INDICATORS = (
+        'Orchestra', 'Symphony', 'Philharmonic', 'Ensemble',
+        'Quartet', 'Trio', 'Quintet', 'Band', 'Choir',
+        '& His', '& Her', '& The', '& Los', '& Les',
+        'Conductor', 'Piano', 'Violin', 'Cello'
+    )
+    
+    # ExtractedAlbumInfo answers run well under 150 tokens; a tight cap keeps the
+    # rate-limit reservation (which counts max_tokens) close to actual usage
+    MAX_RESPONSE_TOKENS = 400
+    
+    def __init__(self, api_client: ResilientAPIClient, model_name: str, trust_tags: bool = False):
         self.api_client = api_client
         self.model_name = model_name
+        self.trust_tags = trust_tags
     
     def _sanitize_unicode(self, text: str) -> str:
         """Sanitize Unicode text to prevent encoding errors."""
+        # ASCII text is always encodable; skip the trial encode
+        if text.isascii():
+            return text
         try:
             text.encode('utf-8')
             return text
         except UnicodeEncodeError:
-            sanitized = []
-            for char in text:
-                try:
-                    char.encode('utf-8')
-                    sanitized.append(char)
-                except UnicodeEncodeError:
-                    sanitized.append('?')
-            return ''.join(sanitized)
+            # Let the codec replace unencodable characters (lone surrogates) with '?'
+            return text.encode('utf-8', errors='replace').decode('utf-8')
     
     def process(self, album_info: AlbumInfo) -> ExtractedAlbumInfo:
         """
@@ -253,26 +531,65 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
         Returns:
             ExtractedAlbumInfo object
         """
-        logger.debug(f"Album Stage 2: Extracting data for {album_info.album_name}")
+        logger.debug("Album Stage 2: Extracting data for %s", album_info.album_name)
         
-        prompt = self._build_extraction_prompt(album_info)
+        if self.trust_tags:
+            local_info = self._try_local_extraction(album_info)
+            if local_info is not None:
+                logger.debug("Album Stage 2: Using embedded tags for %s", album_info.album_name)
+                return self.normalize_extracted_info(local_info)
+        
+        prompt = self.build_extraction_prompt(album_info)
         
         extracted_info = self.api_client.get_structured_response(
             prompt=prompt,
             model=self.model_name,
             response_model=ExtractedAlbumInfo,
-            temperature=0.0
+            temperature=0.0,
+            max_tokens=self.MAX_RESPONSE_TOKENS,
+            system_prompt=self.SYSTEM_PROMPT
         )
         
         # Apply normalization
-        extracted_info = self._normalize_extracted_info(extracted_info)
+        extracted_info = self.normalize_extracted_info(extracted_info)
         
-        logger.debug(f"Album Stage 2: Extracted - Artist: {extracted_info.artist}, "
-                    f"Album: {extracted_info.album_title}, Year: {extracted_info.year}")
+        logger.debug("Album Stage 2: Extracted - Artist: %s, Album: %s, Year: %s",
+                     extracted_info.artist, extracted_info.album_title, extracted_info.year)
         
         return extracted_info
     
-    def _normalize_extracted_info(self, info: ExtractedAlbumInfo) -> ExtractedAlbumInfo:
+    def _try_local_extraction(self, album_info: AlbumInfo) -> Optional[ExtractedAlbumInfo]:
+        """
+        Build extraction results from sampled tags when they clearly describe this folder.
+        
+        Requires an artist, an album tag that appears as whole words in the folder name
+        (so stray or template tags fall through to the LLM) and a four-digit year.
+        """
+        metadata = album_info.sample_metadata
+        artist = metadata.get('albumartist') or metadata.get('artist')
+        album = metadata.get('album')
+        if not artist or not album:
+            return None
+        
+        album_key = WS_RE.sub(' ', _fold_diacritics(album).casefold()).strip()
+        folder_key = WS_RE.sub(' ', _fold_diacritics(album_info.album_name).casefold())
+        # Whole-token match, so a short tag such as '1' does not match 'Prince - 1999'
+        if not album_key or not re.search(rf'(?<!\w){re.escape(album_key)}(?!\w)', folder_key):
+            return None
+        
+        year_match = _TAG_YEAR_RE.search(metadata.get('date') or metadata.get('year') or '')
+        if not year_match:
+            return None
+        
+        return ExtractedAlbumInfo(
+            artist=self._sanitize_unicode(artist),
+            album_title=self._sanitize_unicode(album),
+            year=int(year_match.group(1)),
+            total_tracks=album_info.track_count,
+            disc_count=len(album_info.disc_subdirs) if album_info.has_disc_structure else 1
+        )
+    
+    def normalize_extracted_info(self, info: ExtractedAlbumInfo) -> ExtractedAlbumInfo:
         """Apply normalization rules to extracted info."""
         # If we got "Unknown Artist", try to extract from album title as fallback
         if info.artist == "Unknown Artist" and " - " in info.album_title:
@@ -288,14 +605,6 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
     
     def _try_extract_artist_from_title(self, info: ExtractedAlbumInfo) -> ExtractedAlbumInfo:
         """Try to extract artist from album title if it contains both."""
-        # Common indicators that text is an artist/performer name
-        artist_indicators = [
-            'Orchestra', 'Symphony', 'Philharmonic', 'Ensemble', 
-            'Quartet', 'Trio', 'Quintet', 'Band', 'Choir',
-            '& His', '& Her', '& The', '& Los', '& Les',
-            'Conductor', 'Piano', 'Violin', 'Cello'
-        ]
-        
         # Try to parse "Album - Artist" pattern
         parts = info.album_title.split(' - ')
         if len(parts) >= 2:
@@ -303,18 +612,18 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
             potential_artist = parts[-1].strip()
             
             # Remove format tags from potential artist
-            potential_artist = re.sub(r'\[(XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\].*$', '', potential_artist).strip()
+            potential_artist = _FORMAT_TAG_SUFFIX_RE.sub('', potential_artist).strip()
             
             # Check if it contains artist indicators or looks like a name
-            has_indicator = any(indicator in potential_artist for indicator in artist_indicators)
+            has_indicator = any(indicator in potential_artist for indicator in self.ARTIST_INDICATORS)
             has_ampersand = '&' in potential_artist  # Often indicates collaboration
-            looks_like_name = bool(re.match(r'^[A-Z][a-z]+ [A-Z]', potential_artist))  # Simple name pattern
+            looks_like_name = bool(_NAME_LIKE_RE.match(potential_artist))  # Simple name pattern
             
             if has_indicator or has_ampersand or looks_like_name:
                 # It's likely "Album - Artist" pattern
                 info.artist = potential_artist
                 info.album_title = ' - '.join(parts[:-1]).strip()
-                logger.debug(f"Extracted artist '{info.artist}' from album title")
+                logger.debug("Extracted artist '%s' from album title", info.artist)
         
         return info
     
@@ -339,8 +648,8 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
             return canonical
         
         # Clean up spacing and punctuation
-        artist = re.sub(r'\s+', ' ', artist.strip())
-        artist = re.sub(r'\s*[,/]\s*', ' & ', artist)  # Replace , / with &
+        artist = WS_RE.sub(' ', artist.strip())
+        artist = _ARTIST_SEPARATOR_RE.sub(' & ', artist)  # Replace , / with &
         
         return artist
     
@@ -350,89 +659,44 @@ Soundtracks has subgenres: /Soundtracks/{Film|TV|Game|Stage & Musicals}/TITLE (Y
             return title
             
         # Remove format tags from title
-        format_patterns = [
-            r'\[(FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\]',
-            r'\((FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\)',
-            r'[-_]\s*(FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|SHM-CD|24-\d+)\s*$'
-        ]
-        for pattern in format_patterns:
-            title = re.sub(pattern, '', title, flags=re.IGNORECASE)
+        for pattern in _TITLE_FORMAT_TAG_RES:
+            title = pattern.sub('', title)
         
         # Clean up underscores and spacing
         title = title.replace('_', ' ')
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = WS_RE.sub(' ', title.strip())
         
         return title
     
-    def _build_extraction_prompt(self, album_info: AlbumInfo) -> str:
+    def build_extraction_prompt(self, album_info: AlbumInfo) -> str:
         """Build the extraction prompt for album-level processing."""
         
         # Format existing metadata
-        metadata_str = ""
-        if album_info.sample_metadata:
-            metadata_items = []
-            for key, value in album_info.sample_metadata.items():
-                if value and str(value).strip():
-                    metadata_items.append(f"  {key}: {value}")
-            if metadata_items:
-                metadata_str = f"Sample track metadata:\n" + "\n".join(metadata_items)
-        
-        # Format track listing (show first 10 tracks)
-        track_list = "\n".join([f"  {i+1:02d}. {track}" 
-                               for i, track in enumerate(album_info.track_files[:10])])
-        if len(album_info.track_files) > 10:
-            track_list += f"\n  ... and {len(album_info.track_files) - 10} more tracks"
+        metadata_items = [f"  {key}: {value}" for key, value in album_info.sample_metadata.items()
+                          if value and str(value).strip()]
+        # Sections with no data are left out entirely rather than sent as filler
+        metadata_block = "\n".join(["", "Sample track metadata:", *metadata_items, ""]) if metadata_items else ""
+        
+        # Format track listing (show first few tracks), joined once; the overflow
+        # note is appended unnumbered
+        shown = album_info.track_files[:self.PROMPT_TRACK_LIMIT]
+        track_lines = [f"  {i:02d}. {track}" for i, track in enumerate(shown, 1)]
+        hidden = len(album_info.track_files) - len(shown)
+        if hidden > 0:
+            track_lines.append(f"  ... and {hidden} more tracks")
+        track_list = "\n".join(track_lines)
         
         # Parent directory context (ignore format/series folders)
         norm_parents = _normalized_parents(album_info.parent_dirs)
-        parent_path = " > ".join(norm_parents) if norm_parents else "None"
+        parent_line = f"Parent folders: {' > '.join(norm_parents)}\n" if norm_parents else ""
         
-        return f"""
-Extract album information from this music collection following these normalization rules:
-
-{self.COMPREHENSIVE_RULES}
-
-Album directory: {self._sanitize_unicode(album_info.album_name)}
-Parent folders: {parent_path}
-Total tracks: {album_info.track_count}
+        return f"""Album directory: {self._sanitize_unicode(album_info.album_name)}
+{parent_line}Total tracks: {album_info.track_count}
 {f"Multi-disc album: {len(album_info.disc_subdirs)} discs" if album_info.has_disc_structure else "Single disc album"}
 
 Track listing:
 {track_list}
-
-{metadata_str}
-
-Common folder naming patterns to parse (check these patterns in order):
-1. "Artist - Album Title" (most common)
-2. "Album Title - Artist" (check if second part looks like artist/band/orchestra name)
-3. "Artist - Album Title - Year"
-4. "Album Title - Artist & Orchestra/Conductor [Format]"
-5. For classical: "Work Title - Performer(s) [Format]"
-6. Just "Album Title" with no artist
-
-Examples of pattern #2 and #4 (Album - Artist):
-- "La Folia de la Spagna - Paniagua & Atrium Musicae de Madrid [XRCD24]" → Artist: "Paniagua & Atrium Musicae de Madrid", Album: "La Folia de la Spagna"
-- "The Four Seasons - Salvatore Accardo [XRCD]" → Artist: "Salvatore Accardo", Album: "The Four Seasons"
-- "Carmina Burana - Boston Symphony Orchestra [SACD]" → Artist: "Boston Symphony Orchestra", Album: "Carmina Burana"
-
-Extract and normalize the following album information:
-- artist: The primary album artist or band name (check folder name patterns above, use "Unknown Artist" if unable to determine)
-- album_title: The album title (remove format tags, clean spacing, preserve diacritics, use "Unknown Album" if unable to determine)
-- year: Album release year if found (4-digit number), or null if not found  
-- total_tracks: Confirm the total number of tracks ({album_info.track_count})
-- disc_count: Number of discs (1 for single disc, {len(album_info.disc_subdirs)} if multi-disc)
-
-Important parsing rules:
-- First check if the folder name contains a dash (-) separator
-- If text after the dash contains orchestra/ensemble/band names or performer names, it's likely the artist
-- Words like "Orchestra", "Ensemble", "Quartet", "Trio", "Band", "& His", "& The" often indicate artist names
-- For classical albums, if you see performer names after the work title, extract them as the artist
-- If the album has Chinese/Japanese/Korean characters and you cannot determine the artist/title, use "Unknown Artist" / "Unknown Album"
-- For classical music, identify the COMPOSER as the primary artist if it's a single-composer album
-- For soundtracks, keep the film/show/game title as the album title, not the composer
-- Apply all normalization rules strictly
-- Never return null for artist or album_title fields
-"""
+{metadata_block}"""
 
 
 class AlbumStage3Enrichment:
@@ -468,52 +732,12 @@ F) Library (Pop/Rock/World/etc.) → /Library/{Artist}/{Album - YEAR [tags]}
    - CROSSOVER RULE: Rock adaptations of classical themes (e.g., ELP "Pictures at an Exhibition") stay in Library, not Classical
 """
     
-    def __init__(self, api_client: ResilientAPIClient, model_name: str):
-        self.api_client = api_client
-        self.model_name = model_name
-    
-    def process(self, extracted_info: ExtractedAlbumInfo) -> EnrichedAlbumInfo:
-        """
-        Add semantic enrichment to album data.
-        
-        Args:
-            extracted_info: Structured album data from Stage 2
-            
-        Returns:
-            EnrichedAlbumInfo object
-        """
-        logger.debug(f"Album Stage 3: Enriching {extracted_info.artist} - {extracted_info.album_title}")
-        
-        prompt = self._build_enrichment_prompt(extracted_info)
-        
-        enriched_info = self.api_client.get_structured_response(
-            prompt=prompt,
-            model=self.model_name,
-            response_model=EnrichedAlbumInfo,
-            temperature=0.3
-        )
-        
-        logger.debug(f"Album Stage 3: Enriched with {len(enriched_info.genres)} genres")
-        
-        return enriched_info
-    
-    def _build_enrichment_prompt(self, extracted_info: ExtractedAlbumInfo) -> str:
-        """Build the enrichment prompt for album-level semantic analysis."""
-        
-        disc_info = f" ({extracted_info.disc_count} disc album)" if extracted_info.disc_count and extracted_info.disc_count > 1 else ""
-        year_info = f" ({extracted_info.year})" if extracted_info.year else ""
-        
-        return f"""
-Analyze this music album for classification following these rules:
-
-{self.GENRE_CLASSIFICATION_RULES}
-
-Artist: {extracted_info.artist}
-Album: {extracted_info.album_title}
-Year: {extracted_info.year or "Unknown"}
-Tracks: {extracted_info.total_tracks}{disc_info}
-
-Provide semantic analysis for this complete album:
+    # Album-independent instructions, sent as the system message so every enrichment
+    # request shares one cacheable prefix; the user message carries only the album
+    SYSTEM_PROMPT = """
+Analyze the music album described in the user message for classification following these rules:
+""" + GENRE_CLASSIFICATION_RULES + """
+Provide semantic analysis for the complete album:
 
 1. Genres (3-5 specific genres):
    - Use decision tree order: check Soundtracks first, then Classical, Jazz, Electronic, Compilations, finally Library
@@ -549,25 +773,116 @@ Provide semantic analysis for this complete album:
    - For classical: identify if single-composer work or mixed recital
    - For soundtracks: identify if Film/TV/Game/Stage
    - Note any special series (Best Audiophile Voices, etc.)
+"""
+    
+    # EnrichedAlbumInfo (extraction fields plus four short tag lists) stays under ~300 tokens
+    MAX_RESPONSE_TOKENS = 600
+    
+    def __init__(self, api_client: ResilientAPIClient, model_name: str):
+        self.api_client = api_client
+        self.model_name = model_name
+    
+    def process(self, extracted_info: ExtractedAlbumInfo) -> EnrichedAlbumInfo:
+        """
+        Add semantic enrichment to album data.
+        
+        Args:
+            extracted_info: Structured album data from Stage 2
+            
+        Returns:
+            EnrichedAlbumInfo object
+        """
+        logger.debug("Album Stage 3: Enriching %s - %s", extracted_info.artist, extracted_info.album_title)
+        
+        prompt = self._build_enrichment_prompt(extracted_info)
+        
+        enriched_info = self.api_client.get_structured_response(
+            prompt=prompt,
+            model=self.model_name,
+            response_model=EnrichedAlbumInfo,
+            temperature=0.3,
+            max_tokens=self.MAX_RESPONSE_TOKENS,
+            system_prompt=self.SYSTEM_PROMPT
+        )
+        
+        logger.debug("Album Stage 3: Enriched with %s genres", len(enriched_info.genres))
+        
+        return enriched_info
+    
+    def _build_enrichment_prompt(self, extracted_info: ExtractedAlbumInfo) -> str:
+        """Build the enrichment prompt for album-level semantic analysis."""
+        
+        disc_info = f" ({extracted_info.disc_count} disc album)" if extracted_info.disc_count and extracted_info.disc_count > 1 else ""
+        year_info = f" ({extracted_info.year})" if extracted_info.year else ""
+        
+        return f"""Artist: {extracted_info.artist}
+Album: {extracted_info.album_title}
+Year: {extracted_info.year or "Unknown"}
+Tracks: {extracted_info.total_tracks}{disc_info}
 
 Base your analysis on your knowledge of "{extracted_info.artist}" and the album "{extracted_info.album_title}"{year_info}.
 """
 
 
+class AlbumStage23Combined:
+    """Stages 2 and 3 fused: extraction and enrichment from a single LLM call per album."""
+    
+    # Stage 2's extraction rules followed by Stage 3's classification rules, answered
+    # together as one EnrichedAlbumInfo (which already carries the extraction fields)
+    SYSTEM_PROMPT = (
+        AlbumStage2Extraction.SYSTEM_PROMPT
+        + "\nThen classify the same album.\n"
+        + AlbumStage3Enrichment.SYSTEM_PROMPT
+    )
+    
+    def __init__(self, extraction: AlbumStage2Extraction, model_name: str):
+        self.extraction = extraction
+        self.api_client = extraction.api_client
+        self.model_name = model_name
+    
+    def process(self, album_info: AlbumInfo) -> EnrichedAlbumInfo:
+        """
+        Extract and enrich album data with one structured LLM request.
+        
+        Args:
+            album_info: Album information from Stage 1
+            
+        Returns:
+            EnrichedAlbumInfo object with Stage 2 normalization applied
+        """
+        logger.debug("Album Stage 2+3: Extracting and enriching %s", album_info.album_name)
+        
+        enriched_info = self.api_client.get_structured_response(
+            prompt=self.extraction.build_extraction_prompt(album_info),
+            model=self.model_name,
+            response_model=EnrichedAlbumInfo,
+            temperature=0.2,
+            max_tokens=AlbumStage3Enrichment.MAX_RESPONSE_TOKENS,
+            system_prompt=self.SYSTEM_PROMPT
+        )
+        
+        enriched_info = self.extraction.normalize_extracted_info(enriched_info)
+        
+        logger.debug("Album Stage 2+3: %s - %s with %s genres",
+                     enriched_info.artist, enriched_info.album_title, len(enriched_info.genres))
+        
+        return enriched_info
+
+
 class AlbumStage4Canonicalization:
     """Stage 4: Album Canonicalization & Final Organization with quality gates."""
     
     # Film composers for soundtrack detection
-    FILM_COMPOSERS = {
+    FILM_COMPOSERS = frozenset({
         "Alan Menken", "Hans Zimmer", "Joe Hisaishi", "Ennio Morricone", 
         "Michael Nyman", "Gabriel Yared", "Ramin Djawadi", "James Newton Howard",
         "Daniel Pemberton", "Henry Mancini", "Jérôme Rebotier", "Yuji Nomi",
         "Katsu Hoshi", "Martin O'Donnell", "Michael Salvatori", "John Williams",
         "Howard Shore", "James Horner", "Alexandre Desplat", "Thomas Newman"
-    }
+    })
     
     # Classical composers for composer-first organization
-    CLASSICAL_COMPOSERS = {
+    CLASSICAL_COMPOSERS = frozenset({
         "Johann Sebastian Bach", "Wolfgang Amadeus Mozart", "Ludwig van Beethoven",
         "Antonio Vivaldi", "Pyotr Ilyich Tchaikovsky", "Johannes Brahms",
         "Frédéric Chopin", "Franz Schubert", "Joseph Haydn", "George Frideric Handel",
@@ -576,10 +891,67 @@ class AlbumStage4Canonicalization:
         "Richard Wagner", "Giuseppe Verdi", "Giacomo Puccini", "Hector Berlioz",
         "Felix Mendelssohn", "Robert Schumann", "Franz Liszt", "Joaquín Rodrigo",
         "Manuel de Falla", "Isaac Albéniz", "Enrique Granados", "Heitor Villa-Lobos"
+    })
+    
+    # (composer, lowercased full name, lowercased last name or None when too short to match on)
+    CLASSICAL_COMPOSERS_LC = tuple(
+        (c, c.lower(), c.split()[-1].lower() if len(c.split()[-1]) > 4 else None)
+        for c in sorted(CLASSICAL_COMPOSERS)
+    )
+    
+    # One-scan matchers for "is any composer named in this text"
+    FILM_COMPOSERS_RE = _keyword_union(sorted(c.lower() for c in FILM_COMPOSERS))
+    CLASSICAL_COMPOSER_NAMES_RE = _keyword_union(
+        [name for _, full, last in CLASSICAL_COMPOSERS_LC for name in (full, last) if name]
+    )
+    
+    # Well-known classical works that imply a specific composer
+    WORK_TO_COMPOSER = {
+        'four seasons': 'Antonio Vivaldi',
+        'le quattro stagioni': 'Antonio Vivaldi',
+        'die vier jahreszeiten': 'Antonio Vivaldi',
+        'brandenburg': 'Johann Sebastian Bach',
+        'goldberg variations': 'Johann Sebastian Bach',
+        'well-tempered clavier': 'Johann Sebastian Bach',
+        'art of fugue': 'Johann Sebastian Bach',
+        'moonlight sonata': 'Ludwig van Beethoven',
+        'emperor concerto': 'Ludwig van Beethoven',
+        'eroica': 'Ludwig van Beethoven',
+        'pastoral symphony': 'Ludwig van Beethoven',
+        'requiem k. 626': 'Wolfgang Amadeus Mozart',
+        'magic flute': 'Wolfgang Amadeus Mozart',
+        'don giovanni': 'Wolfgang Amadeus Mozart',
+        'eine kleine nachtmusik': 'Wolfgang Amadeus Mozart',
+        'carmina burana': 'Carl Orff',
+        'bolero': 'Maurice Ravel',
+        'pictures at an exhibition': 'Modest Mussorgsky',
+        'planets': 'Gustav Holst',
+        'concierto de aranjuez': 'Joaquín Rodrigo',
+        'aranjuez': 'Joaquín Rodrigo',
+        '1812 overture': 'Pyotr Ilyich Tchaikovsky',
+        'nutcracker': 'Pyotr Ilyich Tchaikovsky',
+        'swan lake': 'Pyotr Ilyich Tchaikovsky',
+        'sleeping beauty': 'Pyotr Ilyich Tchaikovsky'
     }
     
+    WORK_NAMES_RE = _keyword_union(list(WORK_TO_COMPOSER))
+    
+    # More comprehensive Studio Ghibli film list (ASCII spellings; titles are diacritic-folded)
+    GHIBLI_TERMS = (
+        'ghibli', 'totoro', 'mononoke', 'spirited away', 'howl\'s moving castle',
+        'howl', 'kiki', 'ponyo', 'arrietty', 'laputa', 'castle in the sky',
+        'nausicaa', 'porco rosso', 'earthsea', 'whisper of the heart',
+        'grave of the fireflies', 'pom poko', 'tanuki', 'the cat returns',
+        'my neighbors the yamadas', 'yamadas', 'marnie', 'the wind rises',
+        'princess mononoke', 'ocean waves', 'from up on poppy hill',
+        # Include non-feature short "On Your Mark" (1995)
+        'on your mark'
+    )
+    GHIBLI_TERMS_RE = _keyword_union(list(GHIBLI_TERMS))
+    
     def __init__(self):
-        pass
+        # Box sets and discographies repeat the same artist across many albums
+        self._canonicalize_artist_cached = functools.lru_cache(maxsize=8192)(self._canonicalize_artist)
     
     def process(self, enriched_info: EnrichedAlbumInfo, album_info: AlbumInfo) -> FinalAlbumInfo:
         """
@@ -592,32 +964,39 @@ class AlbumStage4Canonicalization:
         Returns:
             FinalAlbumInfo object with organization details
         """
-        logger.debug(f"Album Stage 4: Finalizing {enriched_info.artist} - {enriched_info.album_title}")
+        logger.debug("Album Stage 4: Finalizing %s - %s", enriched_info.artist, enriched_info.album_title)
+        
+        # Lowercased title/artist shared by classification, the quality gates and path rules
+        album_lower = enriched_info.album_title.lower() if enriched_info.album_title else ""
+        artist_lower = enriched_info.artist.lower() if enriched_info.artist else ""
         
         # Determine organization category with comprehensive rules
-        top_category, sub_category, composer = self._classify_album_comprehensive(enriched_info, album_info)
+        top_category, sub_category, composer = self._classify_album_comprehensive(
+            enriched_info, album_info, album_lower, artist_lower
+        )
         
         # Apply quality gates
         top_category, sub_category = self._apply_quality_gates(
-            enriched_info, album_info, top_category, sub_category
+            enriched_info, album_info, top_category, sub_category, album_lower, artist_lower
         )
         
+        # Extract format tags from album name/folder
+        format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
+        
         # Generate suggested directory path
         suggested_dir = self._generate_album_path_comprehensive(
-            enriched_info, album_info, top_category, sub_category, composer
+            enriched_info, album_info, top_category, sub_category, composer, format_tags,
+            album_lower, artist_lower
         )
         
-        # Extract format tags from album name/folder
-        format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-        
         # Build processing notes
         processing_notes = self._build_processing_notes(
             enriched_info, top_category, sub_category, composer
         )
         
         return FinalAlbumInfo(
-            **enriched_info.dict(),
-            canonical_artist=self._canonicalize_artist(enriched_info.artist),
+            **enriched_info.model_dump(),
+            canonical_artist=self._canonicalize_artist_cached(enriched_info.artist),
             canonical_album_title=self._canonicalize_title(enriched_info.album_title),
             musicbrainz_release_id=None,  # Would implement MusicBrainz lookup here
             top_category=top_category,
@@ -629,8 +1008,8 @@ class AlbumStage4Canonicalization:
             processing_notes=processing_notes
         )
     
-    def _classify_album_comprehensive(self, enriched_info: EnrichedAlbumInfo, 
-                                     album_info: AlbumInfo) -> Tuple[str, Optional[str], Optional[str]]:
+    def _classify_album_comprehensive(self, enriched_info: EnrichedAlbumInfo, album_info: AlbumInfo,
+                                     album_lower: str, artist_lower: str) -> Tuple[str, Optional[str], Optional[str]]:
         """
         Classify album using comprehensive decision tree.
         Returns: (top_category, sub_category, composer_if_classical)
@@ -638,68 +1017,43 @@ class AlbumStage4Canonicalization:
         
         genres_lower = [g.lower() for g in enriched_info.genres]
         genres_text = ' '.join(genres_lower)
-        album_lower = enriched_info.album_title.lower() if enriched_info.album_title else ""
-        artist_lower = enriched_info.artist.lower() if enriched_info.artist else ""
 
         # Safety net (pre): short-circuit obvious artist-based misroutes
         pre = self._safety_net_pre(genres_lower, artist_lower, album_lower)
         if pre:
-            return pre[0], pre[1], pre[2]
+            return pre
         
         # A) Check for Soundtracks FIRST
-        soundtrack_indicators = [
-            'soundtrack', 'score', 'film music', 'game music', 'ost',
-            'original motion picture', 'music from', 'original soundtrack'
-        ]
-        # Anime/Studio Ghibli cues should also trigger soundtrack routing
-        anime_indicators = ['anime', 'ghibli', 'studio ghibli', 'on your mark']
-        
         # Check if artist is a known film composer
-        is_film_composer = any(composer.lower() in artist_lower 
-                              for composer in self.FILM_COMPOSERS)
+        is_film_composer = self.FILM_COMPOSERS_RE.search(artist_lower) is not None
         
-        if (any(term in genres_text for term in soundtrack_indicators + anime_indicators) or 
-            any(term in album_lower for term in soundtrack_indicators + anime_indicators) or
+        if (_SOUNDTRACK_CUES_RE.search(genres_text) or 
+            _SOUNDTRACK_CUES_RE.search(album_lower) or
             is_film_composer):
             
-            # Determine soundtrack sub-category
-            if any(term in genres_text + ' ' + album_lower for term in 
-                  ['musical', 'broadway', 'cast recording', 'royal albert hall', 
-                   'staged concert', 'les misérables', 'les miserables', 'cirque du soleil']):
-                return "Soundtracks", "Stage & Musicals", None
-            elif any(term in genres_text + ' ' + album_lower for term in 
-                    ['game', 'video game', 'halo', 'zelda', 'nintendo']):
-                return "Soundtracks", "Game", None
-            elif any(term in genres_text + ' ' + album_lower for term in 
-                    ['tv', 'television', 'hbo', 'netflix', 'season']):
-                return "Soundtracks", "TV", None
-            elif any(term in genres_text + ' ' + album_lower for term in 
-                    ['anime', 'ghibli', 'studio ghibli', 'on your mark']):
-                return "Soundtracks", "Film", None  # Anime goes under Film
+            # Determine soundtrack sub-category; build the searched text once rather
+            # than re-concatenating it for every cue group
+            cue_text = genres_text + ' ' + album_lower
+            if _STAGE_CUES_RE.search(_fold_diacritics(cue_text)):
+                return _SOUND_STAGE
+            elif _GAME_CUES_RE.search(cue_text):
+                return _SOUND_GAME
+            elif _TV_CUES_RE.search(cue_text):
+                return _SOUND_TV
             else:
-                return "Soundtracks", "Film", None  # Default to Film
+                return _SOUND_FILM  # Default to Film; anime/Ghibli goes here too
         
         # B) Check for Classical (with composer-first logic)
-        classical_indicators = [
-            'classical', 'symphony', 'symphonic', 'concerto', 'opera', 'chamber',
-            'orchestral', 'baroque', 'romantic', 'modern classical', 'sonata',
-            'suite', 'overture', 'requiem', 'mass', 'cantata', 'fugue'
-        ]
-        
-        # Check for classical work patterns
-        classical_patterns = [r'\bOp\.\s*\d+', r'\bBWV\s*\d+', r'\bK\.\s*\d+', 
-                             r'\bKV\s*\d+', r'\bRV\s*\d+', r'No\.\s*\d+']
-        has_classical_pattern = any(re.search(pattern, enriched_info.album_title or '', re.IGNORECASE) 
-                                   for pattern in classical_patterns)
-        
-        if (any(term in genres_text for term in classical_indicators) or has_classical_pattern):
+        has_classical_pattern = _CLASSICAL_WORK_RE.search(enriched_info.album_title or '') is not None
+        
+        if _CLASSICAL_GENRE_RE.search(genres_text) or has_classical_pattern:
             # Determine if single composer or recital
             composer = self._identify_composer(enriched_info)
             if composer:
                 return "Classical", None, composer
             else:
                 # Mixed composers or recital
-                return "Classical", "Recitals", None
+                return _CLASSICAL_RECITALS
         
         # Check if artist is a known classical composer (even if not tagged as classical)
         canonical_artist = ComposerAliases.get_canonical_name(enriched_info.artist)
@@ -709,107 +1063,42 @@ class AlbumStage4Canonicalization:
         # C) Check for Compilations & VA BEFORE Jazz/Electronic to catch audiophile compilations
         # IMPORTANT: Distinguish between single-artist collections and true compilations
         
-        # True compilation indicators (multiple artists)
-        true_compilation_indicators = [
-            'various artists', 'va', 'sampler', 'label sampler', 'multi-artist'
-        ]
-        
-        # Collection-type album titles that could be single artist OR compilation
-        collection_titles = [
-            'greatest hits', 'best of', 'collection', 'anthology', 'essential', 'essentials',
-            'ultimate', 'gold', 'platinum', 'complete'
-        ]
-        
-        # Check for series patterns (these are always compilations)
-        series_patterns = [
-            'best audiophile voices', 'audiophile reference', 'super analog sound',
-            'xrcd sampler', 'test cd', 'demo disc', 'audiophile test'
-        ]
-        
-        # Determine if this is a true compilation or single-artist collection
-        is_true_compilation = False
-        
-        # First check: explicit compilation indicators
-        if (any(term in album_lower for term in true_compilation_indicators) or
-            any(term in artist_lower for term in ['various artists', 'va'])):
-            is_true_compilation = True
-        
-        # Second check: series patterns are always compilations
-        elif any(pattern in album_lower for pattern in series_patterns):
-            is_true_compilation = True
-        
-        # Third check: collection titles need artist verification
-        elif any(term in album_lower for term in collection_titles):
-            # If we have a valid artist that's not "Unknown" or "Various", it's a single-artist collection
-            if (enriched_info.artist and 
-                enriched_info.artist != "Unknown Artist" and
-                enriched_info.artist != "Unknown" and
-                'various' not in artist_lower and
-                'va' != artist_lower):
-                # This is a single-artist collection, NOT a compilation
-                is_true_compilation = False
-            else:
-                # No clear artist or it's Various Artists
-                is_true_compilation = True
-        
-        # Fourth check: LLM flag (but verify it's correct)
-        elif enriched_info.is_compilation:
-            # Double-check the LLM's compilation flag
-            if (enriched_info.artist and 
-                enriched_info.artist != "Unknown Artist" and
-                enriched_info.artist != "Unknown" and
-                'various' not in artist_lower):
-                # LLM might be wrong - if we have a clear single artist, override
-                is_true_compilation = False
-            else:
-                is_true_compilation = True
+        # Unknown/Various artist: the only case where collection titles or the
+        # LLM compilation flag mean a true multi-artist compilation
+        artist_is_va = (not enriched_info.artist or
+                        enriched_info.artist in ("Unknown Artist", "Unknown") or
+                        'various' in artist_lower or
+                        artist_lower == 'va')
+        
+        # Explicit compilation indicators; series patterns are always compilations
+        explicit_hit = bool(_VA_TITLE_RE.search(album_lower) or _VA_ARTIST_RE.search(artist_lower))
+        series_hit = _COMPILATION_SERIES_RE.search(album_lower) is not None
+        collection_hit = _COLLECTION_TITLE_RE.search(album_lower) is not None
+        
+        # Collection titles and the LLM flag only count when there is no clear single artist
+        is_true_compilation = (explicit_hit or series_hit or
+                               (artist_is_va and (collection_hit or enriched_info.is_compilation)))
         
         if is_true_compilation:
-            return "Compilations & VA", None, None
+            return _COMP_VA
 
         # Safety: single-artist collections with collection titles should remain with the artist
-        if (any(term in album_lower for term in collection_titles) and
-            (enriched_info.artist and 
-             enriched_info.artist != "Unknown Artist" and
-             enriched_info.artist != "Unknown" and
-             'various' not in artist_lower and
-             artist_lower.strip() not in {'va', 'various artists'})):
-            return "Library", None, None
+        if collection_hit and not artist_is_va:
+            return _LIBRARY
         
         # Jazz label/series hints (folder/album tokens)
-        JAZZ_LABEL_HINTS = {
-            'blue note', 'prestige', 'riverside', 'contemporary', 'tbm', 'three blind mice',
-            'dcc', 'audio wave'
-        }
         label_context = f"{album_info.album_name} {' '.join(album_info.parent_dirs)}".lower()
-        if any(lbl in label_context for lbl in JAZZ_LABEL_HINTS):
-            return "Jazz", None, None
+        if _JAZZ_LABEL_RE.search(label_context):
+            return _JAZZ
 
         # D) Check for Jazz
-        jazz_indicators = [
-            'jazz', 'blues', 'swing', 'bebop', 'fusion', 'smooth jazz',
-            'cool jazz', 'free jazz', 'hard bop', 'latin jazz'
-        ]
-        if any(term in genres_text for term in jazz_indicators):
-            return "Jazz", None, None
+        if _JAZZ_GENRE_RE.search(genres_text):
+            return _JAZZ
         
         # E) Check for Electronic
-        electronic_indicators = [
-            'electronic', 'techno', 'house', 'ambient', 'edm', 'synth',
-            'electro', 'trance', 'dubstep', 'drum and bass', 'dnb',
-            'breakbeat', 'downtempo', 'chillout', 'idm'
-        ]
-        
-        # Known electronic artists
-        electronic_artists = [
-            'jean-michel jarre', 'jean michel jarre', 'daft punk', 'kitaro',
-            'carpenter brut', 'kraftwerk', 'tangerine dream', 'vangelis', 'magic sword',
-            'deadmau5', 'aphex twin', 'boards of canada', 'massive attack'
-        ]
-        
-        if (any(term in genres_text for term in electronic_indicators) or
-            any(artist in artist_lower for artist in electronic_artists)):
-            return "Electronic", None, None
+        if (_ELECTRONIC_GENRE_RE.search(genres_text) or
+            _ELECTRONIC_ARTISTS_RE.search(artist_lower)):
+            return _ELECTRONIC
         
         # F) Default to Library for everything else
         top, sub = self._safety_net_post("Library", None, artist_lower, album_lower)
@@ -822,51 +1111,25 @@ class AlbumStage4Canonicalization:
         if canonical_artist in self.CLASSICAL_COMPOSERS:
             return canonical_artist
         
-        # Check for well-known classical works that imply a specific composer
-        WORK_TO_COMPOSER = {
-            'four seasons': 'Antonio Vivaldi',
-            'le quattro stagioni': 'Antonio Vivaldi',
-            'die vier jahreszeiten': 'Antonio Vivaldi',
-            'brandenburg': 'Johann Sebastian Bach',
-            'goldberg variations': 'Johann Sebastian Bach',
-            'well-tempered clavier': 'Johann Sebastian Bach',
-            'art of fugue': 'Johann Sebastian Bach',
-            'moonlight sonata': 'Ludwig van Beethoven',
-            'emperor concerto': 'Ludwig van Beethoven',
-            'eroica': 'Ludwig van Beethoven',
-            'pastoral symphony': 'Ludwig van Beethoven',
-            'requiem k. 626': 'Wolfgang Amadeus Mozart',
-            'magic flute': 'Wolfgang Amadeus Mozart',
-            'don giovanni': 'Wolfgang Amadeus Mozart',
-            'eine kleine nachtmusik': 'Wolfgang Amadeus Mozart',
-            'carmina burana': 'Carl Orff',
-            'bolero': 'Maurice Ravel',
-            'pictures at an exhibition': 'Modest Mussorgsky',
-            'planets': 'Gustav Holst',
-            'concierto de aranjuez': 'Joaquín Rodrigo',
-            'aranjuez': 'Joaquín Rodrigo',
-            '1812 overture': 'Pyotr Ilyich Tchaikovsky',
-            'nutcracker': 'Pyotr Ilyich Tchaikovsky',
-            'swan lake': 'Pyotr Ilyich Tchaikovsky',
-            'sleeping beauty': 'Pyotr Ilyich Tchaikovsky'
-        }
-        
         if enriched_info.album_title:
             album_lower = enriched_info.album_title.lower()
             
-            # Check for known works
-            for work, composer in WORK_TO_COMPOSER.items():
-                if work in album_lower:
-                    return composer
+            # Check for known works; one scan rules out most titles before the
+            # ordered loop that decides which work wins
+            if self.WORK_NAMES_RE.search(album_lower):
+                for work, composer in self.WORK_TO_COMPOSER.items():
+                    if work in album_lower:
+                        return composer
             
-            # Check album title for composer names
-            for composer in self.CLASSICAL_COMPOSERS:
-                if composer.lower() in album_lower:
-                    return composer
-                # Check last name only
-                last_name = composer.split()[-1]
-                if len(last_name) > 4 and last_name.lower() in album_lower:
-                    return composer
+            # Check album title for composer names (full name, then last name only).
+            # Most titles name no composer, so one scan rules them all out before the
+            # ordered loop that decides which composer wins
+            if self.CLASSICAL_COMPOSER_NAMES_RE.search(album_lower):
+                for composer, composer_lower, last_name_lower in self.CLASSICAL_COMPOSERS_LC:
+                    if composer_lower in album_lower:
+                        return composer
+                    if last_name_lower and last_name_lower in album_lower:
+                        return composer
         
         # Check for composer in "Composer: Work" pattern
         if enriched_info.album_title and ':' in enriched_info.album_title:
@@ -878,14 +1141,14 @@ class AlbumStage4Canonicalization:
         return None
     
     def _apply_quality_gates(self, enriched_info: EnrichedAlbumInfo, album_info: AlbumInfo,
-                             top_category: str, sub_category: Optional[str]) -> Tuple[str, Optional[str]]:
+                             top_category: str, sub_category: Optional[str],
+                             album_lower: str, artist_lower: str) -> Tuple[str, Optional[str]]:
         """Apply quality gates to correct misclassifications."""
         
-        album_lower = enriched_info.album_title.lower() if enriched_info.album_title else ""
-        artist_lower = enriched_info.artist.lower() if enriched_info.artist else ""
+        mentions_soundtrack = _SOUNDTRACK_MENTION_RE.search(album_lower) is not None
         
         # Quality Gate 1: Les Misérables MUST be in Soundtracks/Stage & Musicals
-        if ('les misérables' in album_lower or 'les miserables' in album_lower):
+        if 'les miserables' in _fold_diacritics(album_lower):
             logger.info(f"Quality Gate: Moving Les Misérables to Soundtracks/Stage & Musicals")
             return "Soundtracks", "Stage & Musicals"
         
@@ -895,9 +1158,7 @@ class AlbumStage4Canonicalization:
             return "Soundtracks", "Stage & Musicals"
         
         # Quality Gate 3: Disney musicals to Soundtracks
-        disney_indicators = ['disney', 'aladdin', 'little mermaid', 'lion king', 
-                            'beauty and the beast', 'frozen', 'moana', 'tangled']
-        if any(term in album_lower for term in disney_indicators):
+        if _DISNEY_RE.search(album_lower):
             if 'broadway' in album_lower or 'cast' in album_lower:
                 logger.info(f"Quality Gate: Moving Disney musical to Soundtracks/Stage & Musicals")
                 return "Soundtracks", "Stage & Musicals"
@@ -906,10 +1167,7 @@ class AlbumStage4Canonicalization:
                 return "Soundtracks", "Film"
         
         # Quality Gate 4: Rock/Pop artists should NOT be in Classical
-        pop_rock_artists = ['beach boys', 'emerson lake palmer', 'elp', 'yes', 'genesis',
-                          'pink floyd', 'led zeppelin', 'queen', 'beatles', 'rolling stones',
-                          'adele', 'santana', 'muse', 'dire straits', 'steely dan']
-        if top_category == "Classical" and any(artist in artist_lower for artist in pop_rock_artists):
+        if top_category == "Classical" and _POP_ROCK_ARTISTS_RE.search(artist_lower):
             logger.info(f"Quality Gate: Moving {enriched_info.artist} from Classical to Library")
             return "Library", None
         
@@ -919,38 +1177,30 @@ class AlbumStage4Canonicalization:
             return "Soundtracks", "Film"
         
         # Quality Gate 6: Game soundtracks
-        game_indicators = ['halo', 'zelda', 'mario', 'final fantasy', 'pokemon', 'nintendo']
-        if any(game in album_lower for game in game_indicators):
+        if _GAME_TITLES_RE.search(album_lower):
             logger.info(f"Quality Gate: Moving game soundtrack to Soundtracks/Game")
             return "Soundtracks", "Game"
         
         # Quality Gate 7: The Cure albums should be in Library, not Soundtracks
         if 'the cure' in artist_lower or 'cure' == artist_lower:
             # Check if it's really their album, not a soundtrack
-            cure_albums = ['staring at the sea', 'kiss me kiss me', 'seventeen seconds', 
-                          'disintegration', 'pornography', 'head on the door']
-            if any(album in album_lower for album in cure_albums) or top_category == "Soundtracks":
+            if _CURE_ALBUMS_RE.search(album_lower) or top_category == "Soundtracks":
                 logger.info(f"Quality Gate: Moving The Cure album to Library")
                 return "Library", None
         
         # Quality Gate 8: Jazz artists wrongly in Soundtracks should move to Jazz
-        jazz_artists = ['bill evans', 'miles davis', 'john coltrane', 'cannonball adderley',
-                       'chet baker', 'sonny rollins', 'thelonious monk', 'art blakey',
-                       'horace silver', 'kenny dorham', 'lee morgan', 'hank mobley',
-                       'johnny coles', 'little johnny c']
-        if top_category == "Soundtracks" and any(artist in artist_lower for artist in jazz_artists):
+        if top_category == "Soundtracks" and _JAZZ_ARTISTS_RE.search(artist_lower):
             # Check it's not really a soundtrack
-            if not any(term in album_lower for term in ['soundtrack', 'ost', 'score', 'music from']):
+            if not mentions_soundtrack:
                 logger.info(f"Quality Gate: Moving jazz album to Jazz category")
                 return "Jazz", None
         
         # Quality Gate 9: Classical works wrongly in Game
         if top_category == "Soundtracks" and sub_category == "Game":
             # Check for classical work patterns
-            classical_patterns = ['sonata', 'concerto', 'symphony', 'quartet', 'quintet']
-            if any(pattern in album_lower for pattern in classical_patterns):
+            if _CLASSICAL_FORMS_RE.search(album_lower):
                 # Check if it's really a game soundtrack
-                if not any(game in album_lower for game in ['zelda', 'halo', 'mario', 'final fantasy']):
+                if not _FAMOUS_GAMES_RE.search(album_lower):
                     logger.info(f"Quality Gate: Moving classical work from Game to Classical")
                     return "Classical", None
         
@@ -961,8 +1211,7 @@ class AlbumStage4Canonicalization:
 
         # Quality Gate: single-artist hits must stay with the artist, not Compilations
         if top_category == "Compilations & VA":
-            solo_hits_artists = {'queen', 'tina turner', 'steely dan', 'dire straits'}
-            if any(a in artist_lower for a in solo_hits_artists):
+            if _SOLO_HITS_ARTISTS_RE.search(artist_lower):
                 logger.info("Quality Gate: Moving single-artist hits collection to Library")
                 return "Library", None
         
@@ -972,10 +1221,9 @@ class AlbumStage4Canonicalization:
             return "Classical", None
         
         # Quality Gate 12: Irish/Celtic music might be miscategorized as Film
-        celtic_indicators = ['kerry dancers', 'irish', 'celtic', 'gaelic']
-        if top_category == "Soundtracks" and any(term in album_lower for term in celtic_indicators):
+        if top_category == "Soundtracks" and _CELTIC_RE.search(album_lower):
             # Unless it really is a soundtrack
-            if not any(term in album_lower for term in ['soundtrack', 'ost', 'score', 'music from']):
+            if not mentions_soundtrack:
                 logger.info(f"Quality Gate: Moving Celtic/Irish music to Library")
                 return "Library", None
         
@@ -985,15 +1233,13 @@ class AlbumStage4Canonicalization:
             if 'mancini' not in artist_lower and 'soundtrack' not in album_lower:
                 logger.info(f"Quality Gate: Moving Charade (likely jazz standard) to appropriate category")
                 # Check if it's jazz
-                if any(artist in artist_lower for artist in jazz_artists):
+                if _JAZZ_ARTISTS_RE.search(artist_lower):
                     return "Jazz", None
                 else:
                     return "Library", None
         
         # Quality Gate 14: "Film Music and Special Effects" is likely a demo/test disc
-        if ('film music and special effects' in album_lower or
-            re.search(r'\b(test cd|audiophile test|test disc|test\b)', album_lower) or
-            re.search(r'\b(demo disc|demo cd|demo)\b', album_lower)):
+        if _TEST_DISC_RE.search(album_lower):
             logger.info(f"Quality Gate: Moving test/demo disc to Compilations")
             return "Compilations & VA", None
         
@@ -1002,7 +1248,7 @@ class AlbumStage4Canonicalization:
             # If it has "& Friends" or year in title without movie name, likely personal album
             if ('friends' in album_lower or 
                 (enriched_info.year and str(enriched_info.year) in album_lower and 
-                 not any(term in album_lower for term in ['soundtrack', 'score', 'ost']))):
+                 not _SCORE_WORDS_RE.search(album_lower))):
                 logger.info(f"Quality Gate: Moving James Newton Howard personal album to Library")
                 return "Library", None
         
@@ -1020,11 +1266,15 @@ class AlbumStage4Canonicalization:
     
     def _generate_album_path_comprehensive(self, enriched_info: EnrichedAlbumInfo, album_info: AlbumInfo,
                                           top_category: str, sub_category: Optional[str], 
-                                          composer: Optional[str]) -> Path:
+                                          composer: Optional[str], format_tags: List[str],
+                                          album_lower: str, artist_lower: str) -> Path:
         """Generate the suggested organized album directory path with comprehensive rules."""
         
+        # Format tag suffix shared by every folder-name branch, e.g. "[SACD] [XRCD]"
+        format_tag_str = ' '.join(f"[{tag}]" for tag in format_tags)
+        
         # Start with music root (parent of album's current location)
-        music_root = album_info.album_path.parents[len(album_info.parent_dirs)]
+        music_root = album_info.music_root
         
         # Build path components
         path_parts = [top_category]
@@ -1042,7 +1292,7 @@ class AlbumStage4Canonicalization:
                 work_title = enriched_info.album_title
                 if composer.split()[-1].lower() in work_title.lower():
                     # Remove composer name from work title
-                    work_title = re.sub(f"{re.escape(composer)}:?\\s*", "", work_title, flags=re.IGNORECASE).strip()
+                    work_title = _composer_prefix_re(composer).sub("", work_title).strip()
                 
                 album_parts.append(work_title)
                 
@@ -1055,9 +1305,8 @@ class AlbumStage4Canonicalization:
                     album_parts.append(str(enriched_info.year))
                 
                 # Add format tags
-                format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-                if format_tags:
-                    album_parts.append(' '.join(f"[{tag}]" for tag in format_tags))
+                if format_tag_str:
+                    album_parts.append(format_tag_str)
                 
                 album_folder = " - ".join(album_parts)
             elif sub_category == "Recitals":
@@ -1070,14 +1319,13 @@ class AlbumStage4Canonicalization:
                 if enriched_info.year:
                     album_parts.append(str(enriched_info.year))
                 
-                format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-                if format_tags:
-                    album_parts.append(' '.join(f"[{tag}]" for tag in format_tags))
+                if format_tag_str:
+                    album_parts.append(format_tag_str)
                 
                 album_folder = " - ".join(album_parts)
             else:
                 # Generic classical
-                album_folder = self._build_standard_album_folder(enriched_info, album_info)
+                album_folder = self._build_standard_album_folder(enriched_info, format_tag_str)
         
         # Handle Soundtracks organization
         elif top_category == "Soundtracks":
@@ -1085,37 +1333,22 @@ class AlbumStage4Canonicalization:
                 path_parts.append(sub_category)
             
             # Special clustering for Studio Ghibli
-            album_lower = enriched_info.album_title.lower() if enriched_info.album_title else ""
-            artist_lower = enriched_info.artist.lower() if enriched_info.artist else ""
-            
-            # More comprehensive Studio Ghibli film list
-            ghibli_terms = [
-                'ghibli', 'totoro', 'mononoke', 'spirited away', 'howl\'s moving castle',
-                'howl', 'kiki', 'ponyo', 'arrietty', 'laputa', 'castle in the sky',
-                'nausicaa', 'nausicaä', 'porco rosso', 'earthsea', 'whisper of the heart',
-                'grave of the fireflies', 'pom poko', 'tanuki', 'the cat returns',
-                'my neighbors the yamadas', 'yamadas', 'marnie', 'the wind rises',
-                'princess mononoke', 'ocean waves', 'from up on poppy hill'
-            ]
-
-            # Include non-feature short "On Your Mark" (1995)
-            ghibli_terms.append('on your mark')
+            album_ascii = _fold_diacritics(album_lower)
             
             # Check both album title and artist (Joe Hisaishi often does Ghibli)
-            if (any(term in album_lower for term in ghibli_terms) or
-                ('hisaishi' in artist_lower and any(term in album_lower for term in ['my neighbor', 'castle', 'princess']))):
+            if (self.GHIBLI_TERMS_RE.search(album_ascii) or
+                ('hisaishi' in artist_lower and _HISAISHI_GHIBLI_RE.search(album_lower))):
                 path_parts.append("Studio Ghibli")
                 # Use the album title as the folder name
                 album_folder = enriched_info.album_title
                 # Add year and format tags if available
                 if enriched_info.year:
                     album_folder += f" - {enriched_info.year}"
-                format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-                if format_tags:
-                    album_folder += " " + ' '.join(f"[{tag}]" for tag in format_tags)
+                if format_tag_str:
+                    album_folder += " " + format_tag_str
             
             # Special clustering for Les Misérables versions
-            elif 'les misérables' in album_lower or 'les miserables' in album_lower:
+            elif 'les miserables' in album_ascii:
                 path_parts.append("Les Misérables")
                 # Add descriptive version name
                 if '1987' in album_lower or 'original broadway' in album_lower:
@@ -1136,18 +1369,16 @@ class AlbumStage4Canonicalization:
                 # Add year and format tags if not already in folder name
                 if enriched_info.year and str(enriched_info.year) not in album_folder:
                     album_folder += f" - {enriched_info.year}"
-                format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-                if format_tags:
-                    album_folder += " " + ' '.join(f"[{tag}]" for tag in format_tags)
+                if format_tag_str:
+                    album_folder += " " + format_tag_str
             else:
                 # Standard soundtrack organization
                 album_parts = [enriched_info.album_title]
                 if enriched_info.year:
                     album_parts.append(str(enriched_info.year))
                 
-                format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-                if format_tags:
-                    album_parts.append(' '.join(f"[{tag}]" for tag in format_tags))
+                if format_tag_str:
+                    album_parts.append(format_tag_str)
                 
                 album_folder = " - ".join(album_parts)
         
@@ -1160,7 +1391,7 @@ class AlbumStage4Canonicalization:
                 volume = self._extract_volume(enriched_info.album_title, series_name)
                 album_folder = volume if volume else enriched_info.album_title
             else:
-                album_folder = self._build_standard_album_folder(enriched_info, album_info)
+                album_folder = self._build_standard_album_folder(enriched_info, format_tag_str)
         
         # Handle standard categories (Library, Jazz, Electronic)
         else:
@@ -1171,7 +1402,7 @@ class AlbumStage4Canonicalization:
                 artist_folder = self._sanitize_filename(enriched_info.artist)
                 path_parts.append(artist_folder)
             
-            album_folder = self._build_standard_album_folder(enriched_info, album_info)
+            album_folder = self._build_standard_album_folder(enriched_info, format_tag_str)
         
         album_folder = self._sanitize_filename(album_folder)
         path_parts.append(album_folder)
@@ -1183,32 +1414,14 @@ class AlbumStage4Canonicalization:
         # Apply orchestra aliases
         performer = OrchestraAliases.get_canonical_name(performer)
         
-        # Clean up conductor/orchestra formatting
-        performer = performer.replace(' & ', ' & ')
-        performer = re.sub(r'\s+', ' ', performer)
-        
-        return performer
+        # Collapse whitespace runs
+        return ' '.join(performer.split())
     
     def _detect_series_name(self, album_title: str) -> Optional[str]:
         """Detect if album belongs to a series."""
-        series_patterns = {
-            'Best Audiophile Voices': r'best audiophile voices',
-            'Audiophile Reference': r'audiophile reference',
-            'Super Analog Sound': r'super analog sound',
-            'The Best Of': r'the best of\s+\w+',
-            'The Essential Collection': r'the essential collection',
-            'The Complete Mike Oldfield': r'the complete mike oldfield',
-            'Super Sound': r'super sound\s*(vol|volume)?',
-            'Three Blind Mice': r'(three blind mice|tbm|the super .* sound of tbm)',
-            'The Best Songs Of The World': r'the best songs of the world',
-            'Max Mix': r'max mix',
-            'JVC XRCD': r'jvc xrcd\d*\s*(sampler|audiophile|collection)',
-            'XRCD Sampler': r'xrcd\d*\s*sampler',
-        }
-        
         album_lower = album_title.lower()
-        for series_name, pattern in series_patterns.items():
-            if re.search(pattern, album_lower):
+        for series_name, pattern in _SERIES_PATTERNS:
+            if pattern.search(album_lower):
                 return series_name
         
         return None
@@ -1216,24 +1429,18 @@ class AlbumStage4Canonicalization:
     def _extract_volume(self, album_title: str, series_name: str) -> Optional[str]:
         """Extract volume/part number from album title."""
         # Look for volume patterns
-        patterns = [
-            r'[Vv]ol(?:ume)?\.?\s*(\d+|[IVX]+)',
-            r'[Pp]art\s*(\d+|[IVX]+)',
-            r'(\d+|[IVX]+)\s*$',  # Number at end
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, album_title)
+        for pattern in _VOLUME_PATTERNS:
+            match = pattern.search(album_title)
             if match:
                 return f"Volume {match.group(1)}"
         
         # Return cleaned album title without series name
-        cleaned = re.sub(re.escape(series_name), '', album_title, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s+', ' ', cleaned.strip())
+        cleaned = _series_name_re(series_name).sub('', album_title)
+        cleaned = WS_RE.sub(' ', cleaned.strip())
         return cleaned if cleaned else None
     
     def _build_standard_album_folder(self, enriched_info: EnrichedAlbumInfo, 
-                                    album_info: AlbumInfo) -> str:
+                                    format_tag_str: str) -> str:
         """Build standard album folder name."""
         # Translate CJK characters if present
         album_title = self._translate_cjk_if_needed(enriched_info.album_title)
@@ -1243,27 +1450,19 @@ class AlbumStage4Canonicalization:
         if enriched_info.year:
             album_parts.append(str(enriched_info.year))
         
-        format_tags = self._extract_format_tags(album_info.album_name, enriched_info.album_title)
-        if format_tags:
-            album_parts.append(' '.join(f"[{tag}]" for tag in format_tags))
+        if format_tag_str:
+            album_parts.append(format_tag_str)
         
         return " - ".join(album_parts)
     
     def _translate_cjk_if_needed(self, text: str) -> str:
         """Translate CJK text to romanized form with original in parentheses."""
-        if not text:
+        # ASCII titles (the common case) cannot contain CJK
+        if not text or text.isascii():
             return text
         
         # Check if text contains CJK characters
-        has_cjk = any(
-            '\u4e00' <= char <= '\u9fff' or  # Chinese
-            '\u3040' <= char <= '\u309f' or  # Hiragana
-            '\u30a0' <= char <= '\u30ff' or  # Katakana
-            '\uac00' <= char <= '\ud7af'     # Korean
-            for char in text
-        )
-        
-        if not has_cjk:
+        if not _CJK_RE.search(text):
             return text
         
         # For now, return original text
@@ -1299,9 +1498,12 @@ class AlbumStage4Canonicalization:
         artist = OrchestraAliases.get_canonical_name(artist)
         
         # Clean spacing
-        artist = re.sub(r'\s+', ' ', artist.strip())
+        artist = WS_RE.sub(' ', artist.strip())
         
-        # Fix capitalization if needed
+        # Fix capitalization if needed. Both checks stop at the first cased
+        # character that disagrees, so mixed-case names (the common case) exit
+        # after a character or two; islower() goes first since names usually
+        # start with a capital
         if artist.islower() or artist.isupper():
             artist = artist.title()
         
@@ -1310,12 +1512,11 @@ class AlbumStage4Canonicalization:
     def _canonicalize_title(self, title: str) -> str:
         """Clean and normalize album title."""
         # Remove format indicators
-        title = re.sub(r'\[(FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|24-\d+|SHM-CD)\]', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\((FLAC|MP3|WAV|ALAC|XRCD|K2HD|SACD|DSD|MFSL|24-\d+|SHM-CD)\)', '', title, flags=re.IGNORECASE)
+        title = _FORMAT_BRACKET_RE.sub('', title)
         
         # Clean underscores and normalize spacing
         title = title.replace('_', ' ')
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = WS_RE.sub(' ', title.strip())
         
         return title
     
@@ -1323,51 +1524,39 @@ class AlbumStage4Canonicalization:
         """Extract format tags from album folder name or title."""
         text = f"{album_name} {album_title}"
         
-        format_patterns = {
-            'XRCD24': r'\bXRCD24\b',
-            'XRCD': r'\bXRCD\b',
-            'K2HD': r'\bK2HD\b',
-            'SHM-CD': r'\bSHM-?CD\b',
-            'MFSL': r'\b(MFSL|Mobile Fidelity)\b',
-            'SACD': r'\bSACD\b',
-            'DSD': r'\bDSD\b',
-            '24-96': r'\b24[-/]96\b',
-            '24-88': r'\b24[-/]88\b',
-            '24-192': r'\b24[-/]192\b'
-        }
+        found_tags = {_FORMAT_TAG_BY_GROUP[m.lastgroup] for m in _FORMAT_TAGS_RE.finditer(text)}
         
-        found_tags = []
-        for tag, pattern in format_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                if tag not in found_tags:  # Avoid duplicates
-                    found_tags.append(tag)
-
-        # Normalize order and uniqueness
-        return sorted(set(found_tags))
+        # Normalize order
+        return sorted(found_tags)
 
     # --- Safety Nets -------------------------------------------------------
     # Iconic pop/rock and jazz artists to prevent misroutes
-    POP_ROCK_LIBRARY = {
+    POP_ROCK_LIBRARY = frozenset({
         'a-ha', 'aha', 'duran duran', 'mecano', 'muse', 'queen', 'tina turner',
         'steely dan', 'dire straits', 'adele', 'beach boys', 'emerson, lake & palmer',
         'ani difranco', 'book of love'
-    }
+    })
 
-    JAZZ_SAFETY = {
+    JAZZ_SAFETY = frozenset({
         'bill evans', 'miles davis', 'john coltrane', 'cannonball adderley', 'chet baker',
         'sonny rollins', 'thelonious monk', 'art blakey', 'horace silver', 'kenny dorham',
         'lee morgan', 'hank mobley', 'gerry mulligan', 'barney kessel', 'ben webster',
         'red garland', 'winton kelly', 'tsuyoshi yamamoto', 'arne domnérus', 'arne domnerus',
         'art pepper'
-    }
+    })
+
+    # Each safety list folded into one longest-first alternation (ties alphabetical,
+    # so the compiled pattern is the same on every run) scanned once per artist
+    POP_ROCK_LIBRARY_RE = _keyword_union(sorted(POP_ROCK_LIBRARY, key=lambda a: (-len(a), a)))
+    JAZZ_SAFETY_RE = _keyword_union(sorted(JAZZ_SAFETY, key=lambda a: (-len(a), a)))
 
     def _safety_net_pre(self, genres_lower: List[str], artist_lower: str, album_lower: str):
         # If artist is iconic pop/rock => Library
-        if any(a in artist_lower for a in self.POP_ROCK_LIBRARY):
-            return ("Library", None, None)
+        if self.POP_ROCK_LIBRARY_RE.search(artist_lower):
+            return _LIBRARY
         # If unmistakably jazz artist => Jazz
-        if any(a in artist_lower for a in self.JAZZ_SAFETY):
-            return ("Jazz", None, None)
+        if self.JAZZ_SAFETY_RE.search(artist_lower):
+            return _JAZZ
         return None
 
     def _safety_net_post(self, top_category: str, sub_category: Optional[str], artist_lower: str, album_lower: str):
@@ -1378,16 +1567,14 @@ class AlbumStage4Canonicalization:
     
     def _sanitize_filename(self, filename: str, max_length: int = 200) -> str:
         """Sanitize filename for cross-platform compatibility."""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove control characters
-        filename = ''.join(char for char in filename if ord(char) >= 32)
-        
-        # Normalize whitespace
-        filename = ' '.join(filename.split())
+        # Replace invalid characters and remove control characters
+        filename = filename.translate(SANITIZE_TABLE)
+        
+        # Normalize whitespace (any run, including NBSP/ideographic space, to one space).
+        # Control characters are already gone, so ASCII names without a double space
+        # have nothing to collapse and skip the regex scan
+        if not filename.isascii() or '  ' in filename:
+            filename = WS_RE.sub(' ', filename)
         
         # Remove leading/trailing dots and spaces
         filename = filename.strip(' .')
@@ -26,6 +26,15 @@ from utils.config_loader import MusicConfig
 
 logger = logging.getLogger(__name__)
 
+# Genre names (lowercased, matched exactly) that decide a track's category
+_CLASSICAL_GENRES = frozenset({'classical', 'symphony', 'concerto', 'opera', 'chamber'})
+_ELECTRONIC_GENRES = frozenset({'electronic', 'techno', 'house', 'ambient', 'edm'})
+_JAZZ_GENRES = frozenset({'jazz', 'blues', 'swing', 'bebop'})
+_SOUNDTRACK_GENRES = frozenset({'soundtrack', 'film score', 'game music'})
+_FILM_GENRES = frozenset({'film', 'movie'})
+_TV_GENRES = frozenset({'tv', 'television'})
+_GAME_GENRES = frozenset({'game', 'video game'})
+
 
 class MusicPipeline:
     """
@@ -340,7 +349,7 @@ class MusicPipeline:
         )
         
         return FinalTrackInfo(
-            **canonical_info.dict(),
+            **canonical_info.model_dump(),
             top_category=top_category,
             sub_category=sub_category,
             suggested_path=suggested_path,
@@ -351,29 +360,29 @@ class MusicPipeline:
     def _classify_track(self, canonical_info: CanonicalTrackInfo) -> tuple[str, Optional[str]]:
         """Classify track into top category and sub-category based on enriched info."""
         
-        # Simple classification logic based on genres
-        genres_lower = [g.lower() for g in canonical_info.genres]
+        # Simple classification logic based on genres; one set makes each check a hash probe
+        genres_lower = {g.lower() for g in canonical_info.genres}
         
         # Check for Classical
-        if any(term in genres_lower for term in ['classical', 'symphony', 'concerto', 'opera', 'chamber']):
+        if not genres_lower.isdisjoint(_CLASSICAL_GENRES):
             return "Classical", None
         
         # Check for Electronic
-        if any(term in genres_lower for term in ['electronic', 'techno', 'house', 'ambient', 'edm']):
+        if not genres_lower.isdisjoint(_ELECTRONIC_GENRES):
             return "Electronic", None
         
         # Check for Jazz
-        if any(term in genres_lower for term in ['jazz', 'blues', 'swing', 'bebop']):
+        if not genres_lower.isdisjoint(_JAZZ_GENRES):
             return "Jazz", None
         
         # Check for Soundtracks
-        if any(term in genres_lower for term in ['soundtrack', 'film score', 'game music']):
+        if not genres_lower.isdisjoint(_SOUNDTRACK_GENRES):
             # Determine sub-category
-            if any(term in genres_lower for term in ['film', 'movie']):
+            if not genres_lower.isdisjoint(_FILM_GENRES):
                 return "Soundtracks", "Film"
-            elif any(term in genres_lower for term in ['tv', 'television']):
+            elif not genres_lower.isdisjoint(_TV_GENRES):
                 return "Soundtracks", "TV"
-            elif any(term in genres_lower for term in ['game', 'video game']):
+            elif not genres_lower.isdisjoint(_GAME_GENRES):
                 return "Soundtracks", "Games"
             else:
                 return "Soundtracks", "Film"  # Default
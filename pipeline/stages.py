@@ -16,7 +16,7 @@ from api.schemas import (
     RawFileInfo, ExtractedTrackInfo, EnrichedTrackInfo, CanonicalTrackInfo
 )
 from api.client import ResilientAPIClient
-from filesystem.file_ops import FileSystemOperations
+from filesystem.file_ops import FileSystemOperations, WS_RE
 from utils.exceptions import (
     FileProcessingError, UnsupportedFormatError, MetadataExtractionError,
     CanonicalizationError, DatabaseError
@@ -24,6 +24,35 @@ from utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Audio-format markers stripped from track titles
+_BRACKETED_FORMAT_RE = re.compile(r'\[(FLAC|MP3|WAV|ALAC)\]', re.IGNORECASE)
+_PAREN_FORMAT_RE = re.compile(r'\(FLAC|MP3|WAV|ALAC\)', re.IGNORECASE)
+
+# Format tags detected in track titles/albums, keyed by regex group name
+_FORMAT_TAG_NAMES = {
+    'xrcd24': 'XRCD24',
+    'xrcd': 'XRCD',
+    'k2hd': 'K2HD',
+    'shmcd': 'SHM-CD',
+    'mfsl': 'MFSL',
+    'sacd': 'SACD',
+    'dsd': 'DSD',
+    'hr_24_96': '24-96',
+    'hr_24_88': '24-88',
+}
+_FORMAT_TAG_RE = re.compile(
+    r'\b(?:(?P<xrcd24>XRCD24)'
+    r'|(?P<xrcd>XRCD)'
+    r'|(?P<k2hd>K2HD)'
+    r'|(?P<shmcd>SHM-?CD)'
+    r'|(?P<mfsl>MFSL|Mobile Fidelity)'
+    r'|(?P<sacd>SACD)'
+    r'|(?P<dsd>DSD)'
+    r'|(?P<hr_24_96>24[-/]96)'
+    r'|(?P<hr_24_88>24[-/]88))\b',
+    re.IGNORECASE
+)
+
 
 class Stage1Triage:
     """Stage 1: Triage & Pre-Processing - Validate files and extract existing metadata."""
@@ -292,7 +321,7 @@ class Stage4Canonicalization:
         artist_lower = enriched_info.artist.lower()
         if artist_lower in known_artists:
             return CanonicalTrackInfo(
-                **enriched_info.dict(),
+                **enriched_info.model_dump(),
                 musicbrainz_id="example-mbid-12345",
                 canonical_artist=known_artists[artist_lower],
                 canonical_album=enriched_info.album,
@@ -308,7 +337,7 @@ class Stage4Canonicalization:
         """Create canonical info when database lookup fails."""
         
         return CanonicalTrackInfo(
-            **enriched_info.dict(),
+            **enriched_info.model_dump(),
             musicbrainz_id=None,
             canonical_artist=self._clean_artist_name(enriched_info.artist),
             canonical_album=enriched_info.album,
@@ -321,36 +350,21 @@ class Stage4Canonicalization:
     def _clean_artist_name(self, artist: str) -> str:
         """Clean and normalize artist name."""
         # Basic cleanup - in practice, this would be more sophisticated
-        artist = re.sub(r'\s+', ' ', artist.strip())
+        artist = WS_RE.sub(' ', artist.strip())
         return artist.title() if artist.islower() or artist.isupper() else artist
     
     def _clean_title(self, title: str) -> str:
         """Clean and normalize track title."""
         # Remove common format indicators
-        title = re.sub(r'\[(FLAC|MP3|WAV|ALAC)\]', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\(FLAC|MP3|WAV|ALAC\)', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = _BRACKETED_FORMAT_RE.sub('', title)
+        title = _PAREN_FORMAT_RE.sub('', title)
+        title = WS_RE.sub(' ', title.strip())
         return title
     
     def _extract_format_tags(self, title: str, album: str) -> List[str]:
         """Extract format tags from title or album name."""
         text = f"{title} {album or ''}"
         
-        format_patterns = {
-            'XRCD24': r'\bXRCD24\b',
-            'XRCD': r'\bXRCD\b',
-            'K2HD': r'\bK2HD\b',
-            'SHM-CD': r'\bSHM-?CD\b',
-            'MFSL': r'\b(MFSL|Mobile Fidelity)\b',
-            'SACD': r'\bSACD\b',
-            'DSD': r'\bDSD\b',
-            '24-96': r'\b24[-/]96\b',
-            '24-88': r'\b24[-/]88\b'
-        }
-        
-        found_tags = []
-        for tag, pattern in format_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                found_tags.append(tag)
-        
-        return found_tags
\ No newline at end of file
+        # One scan over the text; report tags in their canonical order
+        found = {_FORMAT_TAG_NAMES[m.lastgroup] for m in _FORMAT_TAG_RE.finditer(text)}
+        return [tag for tag in _FORMAT_TAG_NAMES.values() if tag in found]
\ No newline at end of file
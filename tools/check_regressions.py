@@ -7,10 +7,13 @@ Parses tests/regression_album_cases.txt lines of the form:
 
 Then constructs synthetic AlbumInfo + EnrichedAlbumInfo and runs
 AlbumStage4Canonicalization to verify top_category[/sub_category].
+Also round-trips one result through the L1 album result cache.
 
 This avoids LLM calls and full library scans, and runs fast.
 """
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -22,6 +25,7 @@ sys.path.insert(0, str(ROOT))
 
 from api.schemas import AlbumInfo, EnrichedAlbumInfo
 from pipeline.album_stages import AlbumStage4Canonicalization
+from caching.cache_manager import CacheManager
 
 
 def parse_case(line: str) -> Optional[Tuple[str, str, str]]:
@@ -44,9 +48,9 @@ def expected_tuple(expected: str) -> Tuple[str, Optional[str]]:
     return expected.strip(), None
 
 
-def classify_case(artist: str, album: str) -> Tuple[str, Optional[str]]:
+def build_case(artist: str, album: str,
+               fake_root: Path = Path("/tmp/music_regression_root")) -> Tuple[AlbumInfo, EnrichedAlbumInfo]:
     # Build minimal AlbumInfo
-    fake_root = Path("/tmp/music_regression_root")
     artist_dir = artist
     album_dir = album
     album_path = fake_root / artist_dir / album_dir
@@ -80,12 +84,43 @@ def classify_case(artist: str, album: str) -> Tuple[str, Optional[str]]:
         energy_level=3,
         is_compilation=False,
     )
+    return album_info, enriched
 
-    stage4 = AlbumStage4Canonicalization()
+
+def classify_case(stage4: AlbumStage4Canonicalization, artist: str, album: str) -> Tuple[str, Optional[str]]:
+    album_info, enriched = build_case(artist, album)
     final = stage4.process(enriched, album_info)
     return final.top_category, final.sub_category
 
 
+def check_album_result_cache(stage4: AlbumStage4Canonicalization) -> Optional[str]:
+    """Round-trip a result through the album result cache; returns a failure description or None."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_root = Path(tmp)
+        album_info, enriched = build_case("Miles Davis", "Kind of Blue", fake_root=tmp_root)
+        album_info.album_path.mkdir(parents=True)
+        for track_path in album_info.track_paths:
+            track_path.touch()
+        final = stage4.process(enriched, album_info)
+
+        cache = CacheManager(
+            execution_cache_file=tmp_root / "execution_cache.db",
+            api_cache_file=tmp_root / "api_cache.json"
+        )
+        if cache.get_album_result(album_info, "settings") is not None:
+            return "hit before anything was cached"
+        cache.cache_album_result(album_info, "settings", final)
+        if cache.get_album_result(album_info, "settings") != final:
+            return "stored result was not returned unchanged"
+        if cache.get_album_result(album_info, "other settings") is not None:
+            return "hit under different settings"
+        # Editing a sampled track's tags changes its mtime
+        os.utime(album_info.track_paths[0], ns=(0, 0))
+        if cache.get_album_result(album_info, "settings") is not None:
+            return "hit after a sampled track changed"
+    return None
+
+
 def main() -> int:
     cases = []
     with open(CASES_FILE, 'r', encoding='utf-8') as f:
@@ -98,15 +133,25 @@ def main() -> int:
     passed = 0
     failures = []
 
+    # One stage instance for the whole run, as the pipeline does
+    stage4 = AlbumStage4Canonicalization()
+
     for artist, album, expected in cases:
         want_top, want_sub = expected_tuple(expected)
-        got_top, got_sub = classify_case(artist, album)
+        got_top, got_sub = classify_case(stage4, artist, album)
         ok = (got_top == want_top) and ((want_sub or None) == (got_sub or None))
         if ok:
             passed += 1
         else:
             failures.append((artist, album, expected, f"{got_top}" + (f"/{got_sub}" if got_sub else "")))
 
+    total += 1
+    cache_failure = check_album_result_cache(stage4)
+    if cache_failure:
+        failures.append(("(album result cache)", "Miles Davis - Kind of Blue", "round-trip", cache_failure))
+    else:
+        passed += 1
+
     print(f"Checked {total} cases: {passed} passed, {len(failures)} failed.")
     if failures:
         print("\nFailures:")